@@ -49,17 +49,24 @@ USAGE:
 python generate_verification_yaml.py input.yaml output.yaml
 python generate_verification_yaml.py --no-sequence input.yaml output.yaml
 python generate_verification_yaml.py --sequence-log input.yaml output.yaml
+python generate_verification_yaml.py input.yaml -
+
+An output path of "-" writes the output YAML to stdout.
 
 FLAGS:
   --no-sequence    Disable ID sequencing (placeholder IDs like .X will remain unchanged)
   --sequence-log   Print a summary of ID renumbering operations to stdout
+                   (to stderr when the output is "-")
 """
 
 import argparse
+import io
 import re
 import os
+import sys
 import tempfile
-from typing import List, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import List, Dict, Optional, Set, TextIO, Tuple
 
 # Base key order for output. Additional keys discovered in the file will be
 # appended after these in alphabetical order.
@@ -71,12 +78,66 @@ BASE_KEY_ORDER = [
 # Matches "render", "renders", "rendered", "rendering" as whole words (case-insensitive)
 BRDG_RENDER_PATTERN = re.compile(r"\brender(?:s|ed|ing)?\b", re.IGNORECASE)
 
+# Compiled regex pattern for classifying "Key: value" lines in the patchers
+# Captures the indentation and key name in one match; the named "block" group
+# is set when the value is a block scalar indicator ("Key: |" / "Key: |-")
+KEY_LINE_PATTERN = re.compile(r"^(\s*)([A-Za-z0-9_]+)\s*:(?P<block>\s*\|)?")
+
+# Compiled regex patterns for the per-item transformation helpers
+# Leading parenthetical classification tags, e.g. "(U) " or "(U) (FOUO) "
+CLASSIFICATION_PREFIX_PATTERN = re.compile(r"^(\s*(?:\([^)]+\)\s*)+)(.*)$")
+# Standalone, case-sensitive "Set" token in a Name
+STANDALONE_SET_PATTERN = re.compile(r"\bSet\b")
+# Standalone, case-sensitive "to" token in a setting Name
+STANDALONE_TO_PATTERN = re.compile(r"\bto\b")
+# First modal/auxiliary verb that ends the subject phrase of a Text line
+SUBJECT_VERB_PATTERN = re.compile(r"\b(shall|is|are|will|must|should)\b")
+
+# Compiled regex patterns for plurality detection (is_plural_subject_phrase)
+DOUBLE_QUOTED_PATTERN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+SINGLE_QUOTED_PATTERN = re.compile(r"'[^'\\]*(?:\\.[^'\\]*)*'")
+TRAILING_MODIFIER_PATTERN = re.compile(
+    r"\b(with|without|using|including|excluding)\b", re.IGNORECASE
+)
+COORDINATION_PATTERN = re.compile(r"\b(and|or)\b")
+LEADING_COUNT_PATTERN = re.compile(r"^(\d+)\b")
+WORD_TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+
+# Compiled regex patterns for the active-verb context checks in
+# normalize_quote_in_pattern (all case-insensitive)
+MODAL_RENDER_OVERLAY_PATTERN = re.compile(r"\bshall\s+(render|overlay)\b", re.IGNORECASE)
+RENDER_VERB_PATTERN = re.compile(r"\brenders?\b", re.IGNORECASE)
+PASSIVE_RENDER_PATTERN = re.compile(r"\b(is|are|was|were)\s+renders?\b", re.IGNORECASE)
+OVERLAY_VERB_PATTERN = re.compile(r"\boverlays?\b", re.IGNORECASE)
+PASSIVE_OVERLAY_PATTERN = re.compile(r"\b(is|are|was|were)\s+overlays?\b", re.IGNORECASE)
+GERUND_RENDER_OVERLAY_PATTERN = re.compile(r"\b(rendering|overlaying)\b", re.IGNORECASE)
+# Prefilter: every pattern above contains one of these stems
+RENDER_OVERLAY_STEM_PATTERN = re.compile(r"render|overlay", re.IGNORECASE)
+
+# Word sets for plurality detection (is_plural_subject_phrase)
+# Determiners skipped at the start of a subject phrase
+LEADING_DETERMINERS = frozenset({"the", "a", "an", "this", "that"})
+# Trailing tokens skipped when choosing the head noun of a subject phrase
+HEAD_STOPWORDS = frozenset({
+    # articles/determiners
+    "the", "a", "an", "this", "that", "these", "those",
+    # coordination
+    "and", "or",
+    # common prepositions/conjunctions
+    "in", "on", "at", "to", "from", "with", "without", "by", "for", "of", "as",
+    "into", "onto", "over", "under", "between", "within", "across", "through",
+    # common trailing adverbs
+    "here", "there",
+})
+# Common singular nouns ending in 's' (avoid obvious false pluralization)
+SINGULAR_S_ENDINGS = frozenset({"status", "news", "chassis"})
+
 # Verification item types
-VERIFICATION_TYPES = {
+VERIFICATION_TYPES = frozenset({
     "Verification",
     "DMGR Verification Requirement",
     "BRDG Verification Requirement"
-}
+})
 
 # ---------------------------------------------------------------------------
 # Modal Verb Normalization Rules
@@ -110,8 +171,13 @@ VERIFICATION_TYPES = {
 #       "requires_setting": False,
 #       "standardness_domains": {"DMGR"},  # Optional: defaults to 'domains' if omitted
 #   }
+#
+# The table is a tuple because it is frozen at import: STANDARD_TEXT_TRIGGERS,
+# STANDARD_TEXT_PATTERNS and SORTED_MODAL_VERB_RULES are derived from it below,
+# and transform_text()/is_standard_text() cache their results. New rules must
+# be added here in the source; changing the rules at runtime has no effect.
 
-MODAL_VERB_RULES = [
+MODAL_VERB_RULES = (
     # High priority: "shall set to" must be processed before "shall set"
     {
         "trigger": "shall set to",
@@ -162,7 +228,43 @@ MODAL_VERB_RULES = [
         "requires_setting": True,  # BRDG only when setting semantics
         "standardness_domains": {"BRDG"},  # Only BRDG considers this standard
     },
-]
+)
+
+# Trigger phrases that make a Text standard, per domain, snapshotted from
+# MODAL_VERB_RULES at import time (standardness_domains, falling back to
+# domains). Used by is_standard_text().
+STANDARD_TEXT_TRIGGERS: Dict[str, Tuple[str, ...]] = {
+    domain: tuple(
+        rule["trigger"]
+        for rule in MODAL_VERB_RULES
+        if domain in rule.get("standardness_domains", rule["domains"])
+    )
+    for domain in ("DMGR", "BRDG", "OTHER")
+}
+
+# One alternation per domain over its STANDARD_TEXT_TRIGGERS, so that
+# is_standard_text() makes a single regex scan instead of one substring
+# scan per trigger. A trigger that contains another trigger (e.g.
+# "shall set to" contains "shall set") can never be the only match, so it
+# is left out and the engine has fewer branches to try at each position.
+# Domains without triggers have no pattern.
+STANDARD_TEXT_PATTERNS: Dict[str, re.Pattern] = {
+    domain: re.compile("|".join(
+        re.escape(trigger)
+        for trigger in triggers
+        if not any(other != trigger and other in trigger for other in triggers)
+    ))
+    for domain, triggers in STANDARD_TEXT_TRIGGERS.items()
+    if triggers
+}
+
+# MODAL_VERB_RULES in processing order, computed once at import time
+# (priority descending, then trigger length descending)
+SORTED_MODAL_VERB_RULES = sorted(
+    MODAL_VERB_RULES,
+    key=lambda r: (r["priority"], len(r["trigger"])),
+    reverse=True
+)
 
 # ---------------------------------------------------------------------------
 # Item Detection Helpers
@@ -307,7 +409,29 @@ def parse_items(path: str) -> List[Dict[str, str]]:
     for these requirement / verification records.
     """
     with open(path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
+        text = f.read()
+    return parse_items_from_text(text)
+
+
+def parse_items_from_text(text: str) -> List[Dict[str, str]]:
+    """
+    Parse already-loaded file content; see parse_items() for the format.
+
+    This lets callers that also need the raw text (e.g., for the in-place
+    patchers) read the input file only once.
+    """
+    # Translate "\r\n" and "\r" line endings to "\n" first, as open() does in
+    # its default universal-newlines mode, so text that did not come through
+    # open() (e.g. a str built in memory) parses the same way.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+    # Split on newlines only, matching file.readlines() (a trailing newline
+    # does not produce an extra empty line). Lines carry no "\n", so they are
+    # used as-is below.
+    lines = text.split("\n")
+    if lines and lines[-1] == "":
+        lines.pop()
 
     items: List[Dict[str, str]] = []
     current: Optional[Dict[str, str]] = None
@@ -315,7 +439,7 @@ def parse_items(path: str) -> List[Dict[str, str]]:
     n = len(lines)
 
     while i < n:
-        raw_line = lines[i].rstrip("\n")
+        raw_line = lines[i]
 
         # Skip completely blank lines (preserved only within block scalars)
         if not raw_line.strip():
@@ -364,9 +488,10 @@ def parse_items(path: str) -> List[Dict[str, str]]:
             if after in ("|", "|-"):
                 block_lines: List[str] = []
                 indent_base = indent
+                block_indent = indent_base + 2
                 i += 1
                 while i < n:
-                    nxt_raw = lines[i].rstrip("\n")
+                    nxt_raw = lines[i]
                     nxt_stripped = nxt_raw.strip()
 
                     # Preserve completely blank lines inside the block
@@ -388,7 +513,6 @@ def parse_items(path: str) -> List[Dict[str, str]]:
                         break
 
                     # Otherwise this is part of the block content
-                    block_indent = indent_base + 2
                     if nxt_indent >= block_indent:
                         block_lines.append(nxt_raw[block_indent:])
                     else:
@@ -444,7 +568,7 @@ def split_leading_classification(s: str) -> tuple[str, str]:
     return (prefix_with_space_preserved, remainder_without_leading_spaces),
     otherwise return ("", s).
     """
-    m = re.match(r"^(\s*(?:\([^)]+\)\s*)+)(.*)$", s)
+    m = CLASSIFICATION_PREFIX_PATTERN.match(s)
     if not m:
         return "", s
     prefix = m.group(1)
@@ -468,9 +592,10 @@ def has_standalone_set(name: str) -> bool:
     Return True if the Name contains the standalone token 'Set'
     (case-sensitive, word boundary).
     """
-    return re.search(r"\bSet\b", name) is not None
+    return STANDALONE_SET_PATTERN.search(name) is not None
 
 
+@lru_cache(maxsize=1024)
 def is_plural_subject_phrase(phrase: str) -> bool:
     """
     Minimal plurality heuristic (purposefully lightweight, no NLP dependencies):
@@ -484,6 +609,9 @@ def is_plural_subject_phrase(phrase: str) -> bool:
     Trailing modifier phrases (introduced by 'with', 'without', 'using', 'including', 
     'excluding') are stripped before determining plurality, so the grammatical subject
     is analyzed rather than nouns in modifier phrases.
+
+    Results are cached per phrase, since transform_text() asks about the same
+    subject phrase once per matching modal verb rule.
     """
     if not phrase:
         return False
@@ -491,9 +619,9 @@ def is_plural_subject_phrase(phrase: str) -> bool:
     def _strip_quoted(text: str) -> str:
         """Remove quoted substrings so quoted tokens don't affect plurality."""
         # Double-quoted segments (supports simple escaped quotes)
-        text = re.sub(r'"[^"\\]*(?:\\.[^"\\]*)*"', " ", text)
+        text = DOUBLE_QUOTED_PATTERN.sub(" ", text)
         # Single-quoted segments (supports simple escaped quotes)
-        text = re.sub(r"'[^'\\]*(?:\\.[^'\\]*)*'", " ", text)
+        text = SINGLE_QUOTED_PATTERN.sub(" ", text)
         return text
 
     def _strip_trailing_modifiers(text: str) -> str:
@@ -512,8 +640,7 @@ def is_plural_subject_phrase(phrase: str) -> bool:
         """
         # Pattern matches word boundaries to avoid matching these words as parts of other words
         # We match the first occurrence of any of these introducers and strip everything after
-        modifier_pattern = r'\b(with|without|using|including|excluding)\b'
-        match = re.search(modifier_pattern, text, re.IGNORECASE)
+        match = TRAILING_MODIFIER_PATTERN.search(text)
         if match:
             # Return everything before the modifier introducer
             return text[:match.start()].rstrip()
@@ -527,44 +654,31 @@ def is_plural_subject_phrase(phrase: str) -> bool:
     # Lists and coordination are strong signals of plurality
     if "," in p_low:
         return True
-    if re.search(r"\b(and|or)\b", p_low):
+    if COORDINATION_PATTERN.search(p_low):
         return True
 
     # Leading numeric count
-    m_num = re.match(r"^(\d+)\b", p_low)
+    m_num = LEADING_COUNT_PATTERN.match(p_low)
     if m_num:
         try:
             return int(m_num.group(1)) != 1
         except ValueError:
             pass
 
-    tokens = re.findall(r"[a-z0-9']+", p_low)
+    tokens = WORD_TOKEN_PATTERN.findall(p_low)
     if not tokens:
         return False
 
-    determiners = {"the", "a", "an", "this", "that"}
     idx = 0
-    while idx < len(tokens) and tokens[idx] in determiners:
+    while idx < len(tokens) and tokens[idx] in LEADING_DETERMINERS:
         idx += 1
     if idx >= len(tokens):
         return False
 
     # Choose a head-ish token from the end, skipping common trailing stopwords.
-    stopwords = {
-        # articles/determiners
-        "the", "a", "an", "this", "that", "these", "those",
-        # coordination
-        "and", "or",
-        # common prepositions/conjunctions
-        "in", "on", "at", "to", "from", "with", "without", "by", "for", "of", "as",
-        "into", "onto", "over", "under", "between", "within", "across", "through",
-        # common trailing adverbs
-        "here", "there",
-    }
-
     head = None
     for t in reversed(tokens[idx:]):
-        if t in stopwords:
+        if t in HEAD_STOPWORDS:
             continue
         head = t
         break
@@ -573,10 +687,7 @@ def is_plural_subject_phrase(phrase: str) -> bool:
         return False
 
     # Common singular nouns ending in 's' (avoid obvious false pluralization)
-    singular_s_endings = {
-        "status", "news", "chassis",
-    }
-    if head in singular_s_endings:
+    if head in SINGULAR_S_ENDINGS:
         return False
 
     # Simple morphological checks
@@ -671,7 +782,7 @@ def transform_name_setting(req_name: str) -> str:
     be = choose_be_verb(base)
 
     # Find the last standalone 'to' (case-sensitive, word boundary)
-    matches = list(re.finditer(r"\bto\b", base))
+    matches = list(STANDALONE_TO_PATTERN.finditer(base))
     if matches:
         start, end = matches[-1].span()
         new_base = base[:start] + f"{be} set to" + base[end:]
@@ -704,7 +815,7 @@ def extract_subject_phrase(line: str) -> str:
     elif s.startswith("the "):
         s = s[4:]
 
-    m = re.search(r"\b(shall|is|are|will|must|should)\b", s)
+    m = SUBJECT_VERB_PATTERN.search(s)
     return s[:m.start()].strip() if m else s
 
 
@@ -738,7 +849,10 @@ def normalize_quote_in_pattern(text: str) -> str:
     Returns:
         Normalized text with patterns fixed
     """
-    if not text:
+    # Fast path: most texts have no '" in' at all, so skip the segment
+    # list and context scans (this is the common case for transform_text(),
+    # which calls this after its modal verb replacements)
+    if not text or '" in' not in text:
         return text
     
     # Pattern: '" in' (double quote followed by space and the word 'in')
@@ -764,11 +878,7 @@ def normalize_quote_in_pattern(text: str) -> str:
         
         # Find the matching opening quote for this closing quote at match_pos
         # We search backwards from the closing quote position
-        opening_quote_pos = -1
-        for i in range(match_pos - 1, -1, -1):
-            if text[i] == '"':
-                opening_quote_pos = i
-                break
+        opening_quote_pos = text.rfind('"', 0, match_pos)
         
         if opening_quote_pos == -1:
             # No opening quote found; keep this occurrence as-is
@@ -797,9 +907,13 @@ def normalize_quote_in_pattern(text: str) -> str:
         # - We do not attempt to match plain "rendered"/"overlaid" as an active verb; typical
         #   passive uses like "is rendered" or "was rendered" are treated as passive
         #   and therefore do not block insertion
-        if not skip_insertion:
+        #
+        # All of these checks need a "render"/"overlay" stem in the context, so a
+        # single stem scan first rules out most labels without running them.
+        context_start = max(0, opening_quote_pos - 100)
+        if not skip_insertion and RENDER_OVERLAY_STEM_PATTERN.search(
+                text, context_start, opening_quote_pos):
             # Extract context before the opening quote
-            context_start = max(0, opening_quote_pos - 100)
             context_before = text[context_start:opening_quote_pos]
             
             # Check for active render/overlay verb patterns in sentence-style text:
@@ -828,19 +942,15 @@ def normalize_quote_in_pattern(text: str) -> str:
             # a preceding passive auxiliary and allow insertion instead of skipping.
             
             # Pattern 1: "shall render" or "shall overlay" anywhere in context (always active voice)
-            if re.search(r'\bshall\s+(render|overlay)\b', context_before, re.IGNORECASE):
+            if MODAL_RENDER_OVERLAY_PATTERN.search(context_before):
                 skip_insertion = True
             # Pattern 2: Present tense "renders", "render", "overlays", or "overlay"
             # Explicitly check for passive voice patterns first, then handle active/command-form
-            render_match = re.search(r'\brenders?\b', context_before, re.IGNORECASE)
+            render_match = RENDER_VERB_PATTERN.search(context_before)
             if render_match:
                 # Found render/renders; explicitly treat "is/are/was/were renders"
                 # as passive voice and everything else as active/command-form.
-                passive_match = re.search(
-                    r'\b(is|are|was|were)\s+renders?\b',
-                    context_before,
-                    re.IGNORECASE,
-                )
+                passive_match = PASSIVE_RENDER_PATTERN.search(context_before)
                 if passive_match:
                     # Passive voice ("is/are/was/were renders"): allow insertion
                     pass
@@ -873,15 +983,11 @@ def normalize_quote_in_pattern(text: str) -> str:
                         # this is active voice (e.g., "Display renders"), skip insertion.
                         skip_insertion = True
             # Pattern 2b: Present tense "overlays" or "overlay" (same logic as render)
-            overlay_match = re.search(r'\boverlays?\b', context_before, re.IGNORECASE)
+            overlay_match = OVERLAY_VERB_PATTERN.search(context_before)
             if overlay_match:
                 # Found overlay/overlays; explicitly treat "is/are/was/were overlays"
                 # as passive voice and everything else as active/command-form.
-                passive_match = re.search(
-                    r'\b(is|are|was|were)\s+overlays?\b',
-                    context_before,
-                    re.IGNORECASE,
-                )
+                passive_match = PASSIVE_OVERLAY_PATTERN.search(context_before)
                 if passive_match:
                     # Passive voice: allow insertion
                     pass
@@ -905,7 +1011,7 @@ def normalize_quote_in_pattern(text: str) -> str:
                     # For overlay: skip insertion in all non-passive cases
                     skip_insertion = True
             # Pattern 3: Gerund "rendering" or "overlaying" (typically active voice)
-            if re.search(r'\b(rendering|overlaying)\b', context_before, re.IGNORECASE):
+            if GERUND_RENDER_OVERLAY_PATTERN.search(context_before):
                 skip_insertion = True
         
         # Apply the decision
@@ -922,6 +1028,7 @@ def normalize_quote_in_pattern(text: str) -> str:
     return ''.join(result_parts)
 
 
+@lru_cache(maxsize=2048)
 def transform_text(req_text: str, is_advanced: bool, is_setting: bool, is_dmgr: bool = False) -> str:
     """
     Transform Requirement Text into Verification Text.
@@ -948,6 +1055,9 @@ def transform_text(req_text: str, is_advanced: bool, is_setting: bool, is_dmgr:
     All replacement checks and operations are performed on the rewritten text (after
     first-line normalization) to ensure consistency and avoid edge cases where
     first-line rewriting might change context.
+
+    Results are cached per argument tuple; requirement texts are frequently
+    repeated in templated files.
     """
     if not req_text:
         return "Verify that the requirement is satisfied."
@@ -989,22 +1099,16 @@ def transform_text(req_text: str, is_advanced: bool, is_setting: bool, is_dmgr:
     else:
         domain = "OTHER"
 
-    # Apply modal verb normalizations using the rule table
-    # Sort rules by priority (descending) then by trigger length (descending)
+    # Apply modal verb normalizations using the rule table, pre-sorted by
+    # priority (descending) then by trigger length (descending)
     # This ensures "shall set to" is processed before "shall set"
-    sorted_rules = sorted(
-        MODAL_VERB_RULES,
-        key=lambda r: (r["priority"], len(r["trigger"])),
-        reverse=True
-    )
-    
     # Apply all applicable rules in order
     # Note: We intentionally process ALL rules (not just first match) because:
     # 1. Text may contain multiple different modal verbs (e.g., "shall render" and "shall overlay")
     # 2. Priority ordering prevents incorrect overlap (e.g., "shall set to" at priority 10
     #    processes before "shall set" at priority 0, so the latter won't match anymore)
     # 3. Each rule operates on the progressively transformed text
-    for rule in sorted_rules:
+    for rule in SORTED_MODAL_VERB_RULES:
         # Skip rules that don't apply to this domain
         if domain not in rule["domains"]:
             continue
@@ -1180,7 +1284,7 @@ def apply_id_sequence_patch(original_text: str, id_map: Dict[str, str]) -> str:
             # This matches the exit logic used in parse_items() (lines 295-302).
             stripped = line.lstrip(" ")
             if stripped:  # Non-empty line with content
-                current_indent = len(line) - len(line.lstrip(" "))
+                current_indent = len(line) - len(stripped)
                 if current_indent <= block_header_indent and (
                     stripped.startswith("- ") or ":" in stripped
                 ):
@@ -1208,8 +1312,11 @@ def apply_id_sequence_patch(original_text: str, id_map: Dict[str, str]) -> str:
             result.append(line)
             continue
         
-        # Check if this line is a block scalar header
-        is_header, header_indent = is_block_scalar_header(line)
+        # Check if this line is a block scalar header (a header must contain
+        # "|", so other lines skip the full header parse)
+        is_header, header_indent = (
+            is_block_scalar_header(line) if "|" in line else (False, 0)
+        )
         if is_header:
             in_block_scalar = True
             block_header_indent = header_indent
@@ -1231,19 +1338,17 @@ def apply_id_sequence_patch(original_text: str, id_map: Dict[str, str]) -> str:
                 if map_key in id_map:
                     new_id = id_map[map_key]
                     # Preserve all original spacing by finding and replacing only the ID value
-                    id_pos = line.find("ID:")
-                    if id_pos != -1:
-                        # Portion after "ID:"
-                        suffix = line[id_pos + 3:]
-                        # Replace only the old ID value within the suffix
+                    prefix, sep, suffix = line.partition("ID:")
+                    if sep:
+                        # Replace only the old ID value within the portion after "ID:"
                         val_pos = suffix.find(id_val)
                         if val_pos != -1:
                             new_suffix = suffix[:val_pos] + new_id + suffix[val_pos + len(id_val):]
-                            new_line = line[:id_pos + 3] + new_suffix
+                            new_line = prefix + sep + new_suffix
                             result.append(new_line)
                             continue
                     # Fallback: if structure is unexpected, use simple replacement
-                    indent = line[:len(line) - len(line.lstrip())]
+                    indent = line[:len(line) - len(stripped)]
                     result.append(f"{indent}- ID: {new_id}")
                     continue
             
@@ -1253,7 +1358,8 @@ def apply_id_sequence_patch(original_text: str, id_map: Dict[str, str]) -> str:
         # Check if this is an ID line within an item
         if in_item and stripped.startswith("ID:"):
             # Extract the ID value
-            id_val = stripped[len("ID:"):].strip()
+            _, _, rest = stripped.partition("ID:")
+            id_val = rest.strip()
             
             # Build the map key with current item index
             map_key = f"{id_val}@{item_index}"
@@ -1261,7 +1367,7 @@ def apply_id_sequence_patch(original_text: str, id_map: Dict[str, str]) -> str:
             # If this ID is in our mapping, replace it
             if map_key in id_map:
                 # Preserve indentation
-                indent = line[:len(line) - len(line.lstrip())]
+                indent = line[:len(line) - len(stripped)]
                 new_id = id_map[map_key]
                 result.append(f"{indent}ID: {new_id}")
                 continue
@@ -1272,7 +1378,11 @@ def apply_id_sequence_patch(original_text: str, id_map: Dict[str, str]) -> str:
     return "\n".join(result)
 
 
-def sequence_requirement_ids(items: List[Dict[str, str]], id_map: Optional[Dict[str, str]] = None) -> List[Dict[str, str]]:
+def sequence_requirement_ids(
+    items: List[Dict[str, str]],
+    id_map: Optional[Dict[str, str]] = None,
+    copy: bool = True,
+) -> List[Dict[str, str]]:
     """
     Apply ID sequencing to the structured items list.
     
@@ -1281,6 +1391,10 @@ def sequence_requirement_ids(items: List[Dict[str, str]], id_map: Optional[Dict[
     Args:
         items: List of parsed item dictionaries
         id_map: Optional pre-computed ID mapping. If None, will be computed.
+        copy: If True (default), sequenced items are shallow copies and the input
+            items are left untouched. If False, the ID is updated in place, which
+            avoids a per-item dict copy when the caller no longer needs the
+            original items.
         
     Returns:
         New list with sequenced IDs applied
@@ -1306,6 +1420,11 @@ def sequence_requirement_ids(items: List[Dict[str, str]], id_map: Optional[Dict[
         map_key = f"{req_id}@{idx}"
         
         if map_key in id_map:
+            if not copy:
+                # Caller opted out of copying: update the ID in place
+                item["ID"] = id_map[map_key]
+                result.append(item)
+                continue
             # Create a shallow copy and update the ID
             # Shallow copy is safe here because we only modify the ID field,
             # and no other code will modify the _order list after this point
@@ -1333,10 +1452,14 @@ def is_requirement_id(req_id: str) -> bool:
     return req_id.startswith("REQU")
 
 
+@lru_cache(maxsize=1024)
 def classify_domain(req_id: str) -> str:
     """
     Classify the domain of a Requirement based on its ID.
     
+    Results are cached per ID, since each Requirement ID is classified both
+    during ID sequencing and during Verification generation.
+    
     Returns:
     - "DMGR" if the ID contains ".DMGR."
     - "BRDG" if the ID contains ".BRDG."
@@ -1365,12 +1488,15 @@ def is_standard_name(req_name: str) -> bool:
     return req_name.startswith("Render ") or req_name.startswith("Set ")
 
 
+@lru_cache(maxsize=4096)
 def is_standard_text(req_text: str, domain: str) -> bool:
     """
     Check if a Requirement Text follows domain-specific standard formatting.
     
-    Uses MODAL_VERB_RULES to determine standardness based on domain.
+    Uses MODAL_VERB_RULES (via the per-domain STANDARD_TEXT_PATTERNS built from
+    the STANDARD_TEXT_TRIGGERS snapshot) to determine standardness based on domain.
     A text is standard if it contains any trigger phrase allowed for the domain.
+    Results are cached per (text, domain), since requirement texts repeat.
     
     Domain-specific standards (derived from MODAL_VERB_RULES):
     - DMGR: Text should contain "shall render", "shall set", or "shall overlay"
@@ -1407,13 +1533,9 @@ def is_standard_text(req_text: str, domain: str) -> bool:
     # 
     # To check for this edge case, generate_verification_items() could be enhanced to
     # cross-check Name and Text together, but that's outside the scope of this refactoring.
-    for rule in MODAL_VERB_RULES:
-        # Use standardness_domains if specified, otherwise use domains
-        standardness_domains = rule.get("standardness_domains", rule["domains"])
-        if domain in standardness_domains and rule["trigger"] in req_text:
-            return True  # Early exit on first match for performance
-    
-    return False
+    # One scan over the domain's trigger alternation; search() stops at the first hit
+    pattern = STANDARD_TEXT_PATTERNS.get(domain)
+    return pattern is not None and pattern.search(req_text) is not None
 
 
 def has_brdg_render_issue(ver_name: str, ver_text: str) -> bool:
@@ -1436,7 +1558,10 @@ def has_brdg_render_issue(ver_name: str, ver_text: str) -> bool:
     return bool(BRDG_RENDER_PATTERN.search(name_to_check)) or bool(BRDG_RENDER_PATTERN.search(text_to_check))
 
 
-def generate_verification_items(items: List[Dict[str, str]]) -> List[Dict[str, str]]:
+def generate_verification_items(
+    items: List[Dict[str, str]],
+    existing_ver_ids: Optional[Set[str]] = None,
+) -> List[Dict[str, str]]:
     """
     For each Requirement item that matches the scope rules, generate a
     corresponding Verification item.
@@ -1462,6 +1587,13 @@ def generate_verification_items(items: List[Dict[str, str]]) -> List[Dict[str, s
     - Verification.Parent_Req is left blank.
     - If Requirement.Traced_To is present, it is copied as-is to the
       Verification (scalar only in this script).
+
+    Existing Verifications:
+    - If existing_ver_ids is given, Requirements whose Verification ID is
+      already in that set are passed through without generating a new
+      Verification (or its FIX comments). This lets the caller take the new
+      Verifications directly from the end of the result without a separate
+      filtering pass.
     """
     result: List[Dict[str, str]] = []
     ver_items: List[Dict[str, str]] = []
@@ -1497,6 +1629,10 @@ def generate_verification_items(items: List[Dict[str, str]]) -> List[Dict[str, s
         # The Verified_By field will be added by apply_verified_by_patch().
         result.append(item)
 
+        # Skip Requirements that already have a Verification in the file
+        if existing_ver_ids is not None and ver_id in existing_ver_ids:
+            continue
+
         # --- Create the Verification item ---
         ver_item: Dict[str, str] = {}
 
@@ -1606,14 +1742,16 @@ def build_global_key_order(items: List[Dict[str, str]]) -> List[str]:
     - Append any additional keys found across all items (except
       internal keys starting with '_'), sorted alphabetically.
     """
-    all_keys = set()
+    # Merge each item's keys at C level and filter internal keys once at the
+    # end, instead of testing every key of every item in Python.
+    all_keys = set(BASE_KEY_ORDER)
     for item in items:
-        for key in item.keys():
-            if not key.startswith("_"):
-                all_keys.add(key)
+        all_keys.update(item.keys())
 
     key_order: List[str] = BASE_KEY_ORDER.copy()
-    extra_keys = sorted(k for k in all_keys if k not in key_order)
+    extra_keys = sorted(
+        k for k in all_keys if not k.startswith("_") and k not in key_order
+    )
     key_order.extend(extra_keys)
     return key_order
 
@@ -1794,6 +1932,9 @@ def apply_verified_by_patch(original_text: str, req_verified_map: Dict[str, str]
             # Some heuristics for where to insert if missing
             last_key_index = -1
             name_key_index = -1
+            # Indentation of those key lines, captured when they are classified
+            last_key_indent = ""
+            name_key_indent = ""
             
             # Track when we're inside a block scalar to avoid matching colons in content
             # Use different names from outer scope to avoid shadowing
@@ -1809,18 +1950,23 @@ def apply_verified_by_patch(original_text: str, req_verified_map: Dict[str, str]
                     patched.append(line)
                     continue
 
+                # Classify the line once; the match is reused by the
+                # block scalar, Verified_By and key-tracking checks below
+                m_key = KEY_LINE_PATTERN.match(line)
+
                 # Detect block scalar start (e.g., "  Text: |" or "  Text: |-")
                 # Check this BEFORE Verified_By to avoid false matches inside Text blocks
                 if not inner_in_block_scalar:
-                    m_block = re.match(r"^(\s*)([A-Za-z0-9_]+)\s*:\s*\|", line)
-                    if m_block:
+                    if m_key and m_key.group("block"):
                         inner_in_block_scalar = True
-                        inner_block_base_indent = len(m_block.group(1))
+                        inner_block_base_indent = len(m_key.group(1))
                         # This is also a key line, so track it
-                        key_name = m_block.group(2)
+                        key_name = m_key.group(2)
                         last_key_index = len(patched)
+                        last_key_indent = m_key.group(1)
                         if key_name == "Name":
                             name_key_index = len(patched)
+                            name_key_indent = last_key_indent
                         patched.append(line)
                         continue
                 
@@ -1838,11 +1984,10 @@ def apply_verified_by_patch(original_text: str, req_verified_map: Dict[str, str]
 
                 # Existing Verified_By: line -> replace value
                 # This is now checked AFTER block scalar detection to avoid false matches
-                m_ver = re.match(r"^(\s*)Verified_By\s*:", line)
-                if m_ver:
+                if m_key and m_key.group(2) == "Verified_By":
                     if not has_verified_by:
                         # Replace the first Verified_By line
-                        indent = m_ver.group(1)
+                        indent = m_key.group(1)
                         patched.append(f"{indent}Verified_By: {ver_id}")
                         has_verified_by = True
                     # Skip any additional Verified_By lines (don't append duplicates)
@@ -1852,13 +1997,14 @@ def apply_verified_by_patch(original_text: str, req_verified_map: Dict[str, str]
                 # We only look at simple "Key: value" patterns at this level.
                 # Lines that belong to a block scalar are handled and skipped above,
                 # so only non-block-scalar lines reach this key-matching logic.
-                m_key = re.match(r"^(\s*)([A-Za-z0-9_]+)\s*:", line)
                 if m_key:
                     key_name = m_key.group(2)
                     # Always track the last key we see (even if it's a block scalar start)
                     last_key_index = len(patched)
+                    last_key_indent = m_key.group(1)
                     if key_name == "Name":
                         name_key_index = len(patched)
+                        name_key_indent = last_key_indent
 
                 patched.append(line)
 
@@ -1866,13 +2012,9 @@ def apply_verified_by_patch(original_text: str, req_verified_map: Dict[str, str]
                 # Compute indentation: prefer Name's indent, then last key's, then a default
                 indent = "  "
                 if name_key_index != -1:
-                    m = re.match(r"^(\s*)", patched[name_key_index])
-                    if m:
-                        indent = m.group(1) or indent
+                    indent = name_key_indent or indent
                 elif last_key_index != -1:
-                    m = re.match(r"^(\s*)", patched[last_key_index])
-                    if m:
-                        indent = m.group(1) or indent
+                    indent = last_key_indent or indent
 
                 insert_line = f"{indent}Verified_By: {ver_id}"
 
@@ -1902,9 +2044,11 @@ def apply_verified_by_patch(original_text: str, req_verified_map: Dict[str, str]
         stripped = line.lstrip()
         
         # Check if we're entering a block scalar
+        # A block scalar header must contain "|", so the C-level substring test
+        # lets the regex run only on candidate lines
         if in_item and not in_block_scalar:
-            m_block = re.match(r"^(\s*)([A-Za-z0-9_]+)\s*:\s*\|", line)
-            if m_block:
+            m_block = KEY_LINE_PATTERN.match(line) if "|" in line else None
+            if m_block and m_block.group("block"):
                 in_block_scalar = True
                 block_base_indent = len(m_block.group(1))
         
@@ -1940,10 +2084,10 @@ def apply_verified_by_patch(original_text: str, req_verified_map: Dict[str, str]
 
         if in_item:
             item_lines.append(line)
-            stripped = line.lstrip()
             # Look for the ID line (e.g., "  ID: REQU.DIS.UI...")
             if stripped.startswith("ID:"):
-                req_id_val = stripped[len("ID:"):].strip()
+                _, _, rest = stripped.partition("ID:")
+                req_id_val = rest.strip()
                 current_req_id = req_id_val
             # Also look for Type if not found on first line
             if current_type is None and stripped.startswith("Type:"):
@@ -1960,31 +2104,44 @@ def apply_verified_by_patch(original_text: str, req_verified_map: Dict[str, str]
     return "\n".join(result)
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(
-        description="Generate Verification entries from Requirement entries in a YAML-like file."
-    )
-    parser.add_argument(
-        "input_file", help="Path to input YAML-like requirements file.")
-    parser.add_argument("output_file", help="Path to output YAML-like file.")
-    parser.add_argument(
-        "--no-sequence",
-        action="store_true",
-        help="Disable ID sequencing (placeholder IDs like .X will remain unchanged)"
-    )
-    parser.add_argument(
-        "--sequence-log",
-        action="store_true",
-        help="Print a summary of ID renumbering operations to stdout"
-    )
-    args = parser.parse_args()
-
-    # 1) Parse the input file for structured items (Requirements + any existing
+def process_stream(
+    in_fp: TextIO,
+    out_fp: TextIO,
+    no_sequence: bool = False,
+    sequence_log: bool = False,
+    log_fp: Optional[TextIO] = None,
+) -> None:
+    """
+    Run the full pipeline from one text stream to another.
+
+    Reads the YAML-like input from in_fp, sequences placeholder IDs (unless
+    no_sequence), patches Verified_By fields, appends the new Verification
+    items and writes the result to out_fp. Any file-like objects work, so
+    callers (e.g. tests) can use io.StringIO instead of files on disk.
+    in_fp should translate line endings like open() does by default: a file
+    opened in text mode, or io.StringIO(text, newline=None).
+    With sequence_log, a summary of ID renumbering is printed to log_fp
+    (stdout if None); pass sys.stderr when out_fp is stdout itself, so the
+    summary does not end up inside the YAML output.
+    """
+    # 1) Parse the input for structured items (Requirements + any existing
     #    Verification items).
-    items = parse_items(args.input_file)
+    #    The input is read once; the same text is parsed here and patched below.
+    original_text = in_fp.read()
+    items = parse_items_from_text(original_text)
+
+    # Collect IDs of any existing Verification items so we don't duplicate them
+    # if the script is run multiple times.
+    # Check against the original (pre-sequencing) items to see what was already
+    # there; this is done before sequencing, which may update items in place.
+    existing_ver_ids = {
+        item.get("ID", "").strip()
+        for item in items
+        if item.get("Type", "").strip() in VERIFICATION_TYPES
+    }
 
     # 2) Conditionally apply ID sequencing based on --no-sequence flag
-    if args.no_sequence:
+    if no_sequence:
         # Skip sequencing: use original items as-is
         id_map = {}
         sequenced_items = items
@@ -1993,34 +2150,38 @@ def main() -> None:
         id_map = build_id_sequence_map(items)
         
         # Log sequencing operations if requested
-        if args.sequence_log and id_map:
-            print("ID Sequencing Summary:")
-            print("=" * 60)
+        if sequence_log and id_map:
+            print("ID Sequencing Summary:", file=log_fp)
+            print("=" * 60, file=log_fp)
             for map_key, new_id in sorted(id_map.items()):
                 # Extract original ID from map_key format "ORIGINAL_ID@INDEX"
                 # The @INDEX suffix is added by build_id_sequence_map() to ensure
                 # uniqueness when multiple items have the same placeholder ID.
                 # Use rsplit to strip the synthetic @INDEX suffix (valid IDs do not contain '@').
                 old_id = map_key.rsplit("@", 1)[0]
-                print(f"  {old_id} -> {new_id}")
-            print("=" * 60)
+                print(f"  {old_id} -> {new_id}", file=log_fp)
+            print("=" * 60, file=log_fp)
         
         # Apply sequencing to structured items (for verification generation)
-        # Pass id_map to avoid rebuilding it
-        sequenced_items = sequence_requirement_ids(items, id_map)
+        # Pass id_map to avoid rebuilding it; the original items are not needed
+        # afterwards, so update IDs in place instead of copying each item
+        sequenced_items = sequence_requirement_ids(items, id_map, copy=False)
+
+    # 3) The original text (needed for both sequenced and non-sequenced paths)
+    #    was already read in step 1.
 
-    # 3) Read original text (needed for both sequenced and non-sequenced paths)
-    with open(args.input_file, "r", encoding="utf-8") as f:
-        original_text = f.read()
-    
     # 4) Apply ID sequencing patch to original text (only if sequencing is enabled)
-    if args.no_sequence:
+    if no_sequence:
         sequenced_text = original_text
     else:
         sequenced_text = apply_id_sequence_patch(original_text, id_map)
 
     # 5) Generate verification items from the sequenced (or original) items
-    items_with_verifications = generate_verification_items(sequenced_items)
+    #    Requirements that already have a Verification in the file are skipped
+    #    so the script can be run multiple times without duplicating them.
+    items_with_verifications = generate_verification_items(
+        sequenced_items, existing_ver_ids=existing_ver_ids
+    )
 
     # 6) Build a map of Requirement ID -> Verified_By (Verification ID)
     #    Extract this from the Verification items, not from Requirements
@@ -2037,41 +2198,10 @@ def main() -> None:
                 req_id = ver_id[1:]  # "VREQU.TEST.1" -> "REQU.TEST.1"
                 req_verified_map[req_id] = ver_id
 
-    # Collect IDs of any existing Verification items so we don't duplicate them
-    # if the script is run multiple times.
-    # Check against the original (pre-sequencing) items to see what was already there
-    existing_ver_ids = {
-        item.get("ID", "").strip()
-        for item in items
-        if item.get("Type", "").strip() in VERIFICATION_TYPES
-    }
-
-    # Filter out only the *new* Verification items that were created by
-    # generate_verification_items (i.e., those whose ID does not already
-    # exist in the original file).
-    # Also include comment entries that immediately precede new verifications.
-    new_ver_items: List[Dict[str, str]] = []
-    pending_comments: List[Dict[str, str]] = []
-    
-    for item in items_with_verifications:
-        # Standalone comment entry - hold it temporarily
-        if "_comment" in item and len(item) == 1:
-            pending_comments.append(item)
-            continue
-        
-        item_type = item.get("Type", "").strip()
-        # If this is a verification item
-        if item_type in VERIFICATION_TYPES:
-            ver_id = item.get("ID", "").strip()
-            # If it's a new verification, include any pending comments and the item
-            if ver_id and ver_id not in existing_ver_ids:
-                new_ver_items.extend(pending_comments)
-                new_ver_items.append(item)
-            # Clear pending comments either way
-            pending_comments = []
-        else:
-            # Not a verification, so clear pending comments (they were for requirements)
-            pending_comments = []
+    # The new Verification items (and their FIX comments) are everything that
+    # generate_verification_items() appended after the passed-through items;
+    # Requirements with an existing Verification were already skipped there.
+    new_ver_items: List[Dict[str, str]] = items_with_verifications[len(sequenced_items):]
 
     # 7) Apply Verified_By patch to the sequenced text (using updated IDs from sequencing)
     updated_text = apply_verified_by_patch(sequenced_text, req_verified_map)
@@ -2079,21 +2209,83 @@ def main() -> None:
     # 8) If there are no new Verification items to add, we're done after updating
     #    the Verified_By fields in-place.
     if not new_ver_items:
-        with open(args.output_file, "w", encoding="utf-8") as f:
-            f.write(updated_text)
+        out_fp.write(updated_text)
         return
 
     # Otherwise, render only the new Verification items and append them.
     extra_text = render_items_to_string(new_ver_items)
 
-    with open(args.output_file, "w", encoding="utf-8") as f:
-        # Preserve the original content (with updated IDs and Verified_By) exactly,
-        # then add a blank line and the new Verification section.
-        f.write(updated_text.rstrip("\n"))
-        f.write("\n\n")
-        f.write(extra_text)
-        f.write("\n")
+    # Preserve the original content (with updated IDs and Verified_By) exactly,
+    # then add a blank line and the new Verification section.
+    out_fp.write(updated_text.rstrip("\n"))
+    out_fp.write("\n\n")
+    out_fp.write(extra_text)
+    out_fp.write("\n")
+
+
+def process_yaml_text(text: str, no_sequence: bool = False) -> str:
+    """
+    Run the full pipeline on YAML-like text and return the output text.
+
+    A string-in/string-out wrapper around process_stream() for callers
+    (e.g. tests) that hold the input in memory. CRLF and CR line endings are
+    translated to "\n" on the way in, so the output matches the CLI's.
+    """
+    out_buf = io.StringIO()
+    process_stream(io.StringIO(text, newline=None), out_buf, no_sequence=no_sequence)
+    return out_buf.getvalue()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    argv defaults to sys.argv[1:]; passing a list lets callers (e.g. tests)
+    run the tool in-process. Returns the process exit code.
+    """
+    parser = argparse.ArgumentParser(
+        description="Generate Verification entries from Requirement entries in a YAML-like file."
+    )
+    parser.add_argument(
+        "input_file", help="Path to input YAML-like requirements file.")
+    parser.add_argument(
+        "output_file", help="Path to output YAML-like file, or '-' for stdout.")
+    parser.add_argument(
+        "--no-sequence",
+        action="store_true",
+        help="Disable ID sequencing (placeholder IDs like .X will remain unchanged)"
+    )
+    parser.add_argument(
+        "--sequence-log",
+        action="store_true",
+        help="Print a summary of ID renumbering operations to stdout "
+             "(stderr when the output file is '-')"
+    )
+    args = parser.parse_args(argv)
+
+    # Build the whole output before opening the output file, so that the
+    # input may be rewritten in place (input_file == output_file).
+    # With output to stdout, the sequencing summary goes to stderr so the
+    # YAML stream stays valid.
+    to_stdout = args.output_file == "-"
+    out_buf = io.StringIO()
+    with open(args.input_file, "r", encoding="utf-8") as in_fp:
+        process_stream(
+            in_fp,
+            out_buf,
+            no_sequence=args.no_sequence,
+            sequence_log=args.sequence_log,
+            log_fp=sys.stderr if to_stdout else None,
+        )
+
+    if to_stdout:
+        sys.stdout.write(out_buf.getvalue())
+    else:
+        with open(args.output_file, "w", encoding="utf-8") as out_fp:
+            out_fp.write(out_buf.getvalue())
+
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
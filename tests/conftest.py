@@ -2,61 +2,119 @@
 Pytest configuration and shared fixtures for requ-to-vrequ test suite.
 
 This module provides common test fixtures and utilities used across multiple test files.
+
+The repository root is put on sys.path by `pythonpath = .` in pytest.ini, so
+test modules import generate_verification_yaml directly, without their own
+sys.path.insert() boilerplate. Modules that shell out to the script import
+SCRIPT_PATH from here, which also puts the root on sys.path when a test file
+is run directly as ``python tests/test_*.py``.
 """
 
-import sys
 import os
-import tempfile
+import io
+import sys
+import copy
+import contextlib
+import hashlib
 import pytest
 
-# Add parent directory to path to import the module under test
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Repository root (the parent of tests/) and the script under test
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT_PATH = os.path.join(REPO_ROOT, 'generate_verification_yaml.py')
 
+# pytest.ini already does this under pytest; needed for the __main__ runners
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
 
-@pytest.fixture
-def temp_yaml_file():
+
+@pytest.fixture(scope="session")
+def temp_yaml_file(tmp_path_factory):
     """
-    Fixture to create and cleanup temporary YAML files.
+    Fixture to create temporary YAML files.
     
     Usage:
         def test_something(temp_yaml_file):
             yaml_content = "- Type: Requirement\\n  ID: REQU.1"
             temp_path = temp_yaml_file(yaml_content)
-            # temp_path is automatically cleaned up after the test
     
-    Yields:
+    The fixture is session-scoped and deduplicates by content: identical YAML
+    bodies map to a single file, so tests must treat the returned file as
+    read-only (outputs go to separate paths).
+    
+    Files live in a directory from pytest's tmp_path_factory, so pytest
+    handles cleanup (and honours --basetemp / TMPDIR, e.g. a tmpfs on CI).
+    Under pytest-xdist each worker process gets its own cache and its own
+    directory, named after the worker.
+    
+    Returns:
         A function that creates a temporary YAML file and returns its path.
-        The file is automatically deleted after the test completes.
     """
-    temp_files = []
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    temp_dir = tmp_path_factory.mktemp(f"yaml_{worker}")
+    cache = {}
     
     def _create_temp_file(content):
-        """Create a temporary YAML file with the given content."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            temp_path = f.name
-            f.write(content)
-        temp_files.append(temp_path)
-        return temp_path
+        """Create (or reuse) a temporary YAML file with the given content."""
+        data = content.encode('utf-8')
+        key = hashlib.blake2b(data, digest_size=16).hexdigest()
+        if key not in cache:
+            path = temp_dir / f"{key}.yaml"
+            path.write_bytes(data)
+            cache[key] = str(path)
+        return cache[key]
     
-    yield _create_temp_file
+    return _create_temp_file
+
+
+@pytest.fixture(scope="session")
+def parsed_items():
+    """
+    Session-scoped fixture that parses YAML text with parse_items_from_text().
     
-    # Cleanup all created temporary files
-    for path in temp_files:
-        if os.path.exists(path):
-            try:
-                os.remove(path)
-            except OSError:
-                pass  # Ignore cleanup errors
+    Usage:
+        def test_something(parsed_items):
+            items = parsed_items(yaml_content)
+    
+    Results are memoized by the text itself, so identical YAML bodies are
+    parsed once per session. Keying on the str (rather than a digest of it)
+    is cheap for module-level YAML constants: str caches its hash and dict
+    lookups short-circuit on identity. Each call returns a deep copy so tests
+    can mutate their items without affecting other tests.
+    """
+    from generate_verification_yaml import parse_items_from_text
+    
+    cache = {}
+    
+    def _parse(text):
+        """Return a private copy of the parsed items for the given text."""
+        items = cache.get(text)
+        if items is None:
+            items = cache[text] = parse_items_from_text(text)
+        return copy.deepcopy(items)
+    
+    return _parse
 
 
-def get_script_path():
+@pytest.fixture(scope="session")
+def run_cli():
     """
-    Get the absolute path to the main generate_verification_yaml.py script.
+    Session-scoped fixture that runs the generator's CLI in-process.
     
-    Returns:
-        str: Absolute path to the script
+    Usage:
+        def test_something(run_cli):
+            exit_code, stdout = run_cli("--sequence-log", input_path, output_path)
+    
+    The module is imported once and main() is called with an explicit argv,
+    so each run skips interpreter startup and module import, which dominate
+    the cost of spawning the script with subprocess.
     """
-    return os.path.join(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-        'generate_verification_yaml.py'
-    )
+    from generate_verification_yaml import main
+    
+    def _run(*argv):
+        """Run main(argv) and return (exit_code, captured stdout)."""
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            exit_code = main([str(arg) for arg in argv])
+        return exit_code, buf.getvalue()
+    
+    return _run
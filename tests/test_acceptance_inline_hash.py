@@ -9,21 +9,12 @@ This test validates all acceptance criteria from the issue:
 4. Generated Verification items also preserve hash characters
 """
 
-import sys
-import os
+import pytest
 
-# Add parent directory to path to import the module
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from generate_verification_yaml import generate_verification_items
 
-from generate_verification_yaml import parse_items, generate_verification_items
 
-
-def test_acceptance_criteria(temp_yaml_file):
-    """
-    Test all acceptance criteria from the issue.
-    """
-    # Create test input with all acceptance criteria scenarios
-    test_yaml = """# Preamble comment
+TEST_YAML = """# Preamble comment
 - Type: Requirement
   Parent_Req: 
   ID: REQU.DISPLAY.1
@@ -44,18 +35,25 @@ def test_acceptance_criteria(temp_yaml_file):
   Verified_By: 
   Traced_To: 
 """
+
+
+@pytest.fixture(scope="module")
+def items_by_id(parsed_items):
+    """
+    Parse TEST_YAML and generate verification items once for the module,
+    indexed by ID (requirements and generated verifications alike).
+    """
+    items = generate_verification_items(parsed_items(TEST_YAML))
+    return {item["ID"]: item for item in items if "ID" in item}
+
+
+def test_acceptance_criteria(parsed_items, items_by_id):
+    """
+    Test all acceptance criteria from the issue.
+    """
+    items = parsed_items(TEST_YAML)
     
-    temp_path = temp_yaml_file(test_yaml)
-    
-    # Parse items
-    items = parse_items(temp_path)
-    
-    # Find REQU.DISPLAY.1
-    req1 = None
-    for item in items:
-        if item.get("ID") == "REQU.DISPLAY.1":
-            req1 = item
-            break
+    req1 = items_by_id.get("REQU.DISPLAY.1")
     
     assert req1 is not None, "REQU.DISPLAY.1 not found"
     
@@ -74,123 +72,45 @@ def test_acceptance_criteria(temp_yaml_file):
     # ACCEPTANCE CRITERION 3: Full-line comments captured
     # Note: Comments before the first item are standalone, but comments between items
     # are stored in the previous item's _order field (per parser design)
-    standalone_comment_count = sum(1 for item in items if "_comment" in item and len(item) == 1)
+    standalone_comment_count = 0
+    preamble_found = False
+    for item in items:
+        if "_comment" in item and len(item) == 1:
+            standalone_comment_count += 1
+            if item["_comment"] == "# Preamble comment":
+                preamble_found = True
+    
     assert standalone_comment_count >= 1, \
         f"AC3 FAILED: Expected at least 1 standalone comment, got {standalone_comment_count}"
-    
-    # Check that preamble comment exists
-    preamble_found = any(
-        item.get("_comment", "") == "# Preamble comment"
-        for item in items if "_comment" in item and len(item) == 1
-    )
     assert preamble_found, "AC3 FAILED: Preamble comment not found"
     
     # Check that in-document comment exists (in req1's _order field)
-    comment_in_order_found = False
-    for item in items:
-        if item.get("ID") == "REQU.DISPLAY.1":
-            for kind, payload in item.get("_order", []):
-                if kind == "comment" and "Full-line comment before second requirement" in payload:
-                    comment_in_order_found = True
-                    break
+    comment_in_order_found = any(
+        kind == "comment" and "Full-line comment before second requirement" in payload
+        for kind, payload in req1.get("_order", [])
+    )
     assert comment_in_order_found, "AC3 FAILED: Comment before REQU.PROCESS.2 not found in _order"
-    
-    # Find REQU.PROCESS.2 and check multiline text with hash lines
-    req2 = None
-    for item in items:
-        if item.get("ID") == "REQU.PROCESS.2":
-            req2 = item
-            break
-    
-    assert req2 is not None, "REQU.PROCESS.2 not found"
-    
-    name2 = req2.get("Name", "")
-    assert "#42" in name2 and "#99" in name2, \
-        f"Name should contain '#42' and '#99', got '{name2}'"
-    
-    text2 = req2.get("Text", "")
-    assert "# Reference format:" in text2, \
-        f"Multiline block should preserve lines starting with '#', got '{text2}'"
-    assert "owner/repo#number" in text2, \
-        f"Multiline block should preserve '#' in content, got '{text2}'"
-    
-    # Generate verification items
-    items_with_ver = generate_verification_items(items)
-    
-    # Find VREQU.DISPLAY.1
-    ver1 = None
-    for item in items_with_ver:
-        if item.get("ID") == "VREQU.DISPLAY.1":
-            ver1 = item
-            break
-    
-    assert ver1 is not None, "VREQU.DISPLAY.1 not generated"
-    
-    # Verification Name should preserve hash from original
-    ver_name1 = ver1.get("Name", "")
-    assert "#1" in ver_name1, \
-        f"Verification Name should preserve '#1', got '{ver_name1}'"
-    
-    # Verification Text should preserve hash pattern from original
-    ver_text1 = ver1.get("Text", "")
-    assert "###.###" in ver_text1, \
-        f"Verification Text should preserve '###.###', got '{ver_text1}'"
-    
-    # Find VREQU.PROCESS.2
-    ver2 = None
-    for item in items_with_ver:
-        if item.get("ID") == "VREQU.PROCESS.2":
-            ver2 = item
-            break
-    
-    assert ver2 is not None, "VREQU.PROCESS.2 not generated"
-    
-    ver_name2 = ver2.get("Name", "")
-    assert "#42" in ver_name2 and "#99" in ver_name2, \
-        f"Verification Name should preserve multiple hashes, got '{ver_name2}'"
-    
-    ver_text2 = ver2.get("Text", "")
-    assert "# Reference format:" in ver_text2, \
-        f"Verification Text should preserve multiline hash lines, got '{ver_text2}'"
 
 
-def _create_temp_file_standalone(content):
-    """Standalone temp file creator for when pytest is not available.
-    
-    Creates a temporary file and registers cleanup to run on process exit.
+@pytest.mark.parametrize("item_id,field,needle", [
+    # Multiline requirement: inline hashes and hash-prefixed block lines
+    ("REQU.PROCESS.2", "Name", "#42"),
+    ("REQU.PROCESS.2", "Name", "#99"),
+    ("REQU.PROCESS.2", "Text", "# Reference format:"),
+    ("REQU.PROCESS.2", "Text", "owner/repo#number"),
+    # ACCEPTANCE CRITERION 4: generated Verification items preserve hashes
+    ("VREQU.DISPLAY.1", "Name", "#1"),
+    ("VREQU.DISPLAY.1", "Text", "###.###"),
+    ("VREQU.PROCESS.2", "Name", "#42"),
+    ("VREQU.PROCESS.2", "Name", "#99"),
+    ("VREQU.PROCESS.2", "Text", "# Reference format:"),
+])
+def test_hash_preserved(items_by_id, item_id, field, needle):
     """
-    import tempfile
-    import atexit
-    
-    tmp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False)
-    try:
-        tmp_file.write(content)
-        tmp_path = tmp_file.name
-    finally:
-        # Ensure the file handle is closed so data is flushed to disk.
-        tmp_file.close()
-    
-    def _cleanup_temp_file() -> None:
-        """Remove the standalone temporary file on process exit."""
-        try:
-            os.remove(tmp_path)
-        except FileNotFoundError:
-            # File was already removed; nothing to do.
-            pass
-        except OSError:
-            # Ignore other OS errors during cleanup to avoid masking test results.
-            pass
+    Test that hash characters survive parsing and verification generation.
+    """
+    assert item_id in items_by_id, f"{item_id} not found"
     
-    atexit.register(_cleanup_temp_file)
-    return tmp_path
-
-
-if __name__ == '__main__':
-    try:
-        import pytest
-        pytest.main([__file__, '-v'])
-    except ImportError:
-        # Fallback to basic test runner if pytest is not available
-        print("pytest not available, running tests directly")
-        test_acceptance_criteria(_create_temp_file_standalone)
-        print("All tests passed!")
+    value = items_by_id[item_id].get(field, "")
+    assert needle in value, \
+        f"{item_id} {field} should preserve '{needle}', got '{value}'"
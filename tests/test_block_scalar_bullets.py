@@ -10,14 +10,20 @@ counted lines starting with "- " inside block scalars as new items, causing
 item_index drift and misalignment with the id_map.
 """
 
+import re
+
 from generate_verification_yaml import (
     parse_items,
+    parse_items_from_text,
     build_id_sequence_map,
     apply_id_sequence_patch,
 )
 
+# Matches the value of every "ID:" line, in file order
+ID_LINE_RE = re.compile(r'^\s*ID:\s*(\S+)', re.M)
+
 
-def test_block_scalar_bullets_do_not_affect_item_indexing(temp_yaml_file):
+def test_block_scalar_bullets_do_not_affect_item_indexing(parsed_items):
     """
     Test that bullet points inside block scalars don't affect item counting.
     
@@ -52,8 +58,7 @@ def test_block_scalar_bullets_do_not_affect_item_indexing(temp_yaml_file):
   Name: Fourth requirement (placeholder)
 """
     
-    temp_path = temp_yaml_file(test_yaml)
-    items = parse_items(temp_path)
+    items = parsed_items(test_yaml)
     
     # Verify parse_items creates exactly 4 items (4 requirements, no comments)
     assert len(items) == 4, f"Expected 4 items (4 requirements), got {len(items)}"
@@ -100,16 +105,14 @@ def test_block_scalar_bullets_do_not_affect_item_indexing(temp_yaml_file):
     assert "- feature A" in sequenced_text
     assert "- feature B" in sequenced_text
     
-    # Verify the sequence is in order by checking positions
-    pos_89 = sequenced_text.find("ID: REQU.STEM.89")
-    pos_90 = sequenced_text.find("ID: REQU.STEM.90")
-    pos_91 = sequenced_text.find("ID: REQU.STEM.91")
-    pos_92 = sequenced_text.find("ID: REQU.STEM.92")
-    
-    assert pos_89 < pos_90 < pos_91 < pos_92, "IDs should appear in order: 89, 90, 91, 92"
+    # Verify the sequence is in order with a single scan of the ID lines
+    found_ids = ID_LINE_RE.findall(sequenced_text)
+    assert found_ids == [
+        "REQU.STEM.89", "REQU.STEM.90", "REQU.STEM.91", "REQU.STEM.92"
+    ], f"IDs should appear in order: 89, 90, 91, 92, got {found_ids}"
 
 
-def test_block_scalar_bullets_multiple_blocks(temp_yaml_file):
+def test_block_scalar_bullets_multiple_blocks(parsed_items):
     """
     Test with multiple block scalars containing bullets in the same file.
     """
@@ -138,18 +141,15 @@ def test_block_scalar_bullets_multiple_blocks(temp_yaml_file):
     - last item
 """
     
-    temp_path = temp_yaml_file(test_yaml)
-    items = parse_items(temp_path)
+    items = parsed_items(test_yaml)
     id_map = build_id_sequence_map(items)
     
     # Apply patch
     sequenced_text = apply_id_sequence_patch(test_yaml, id_map)
     
-    # Verify sequencing
-    assert "ID: REQU.TEST.1" in sequenced_text
-    assert "ID: REQU.TEST.2" in sequenced_text
-    assert "ID: REQU.TEST.3" in sequenced_text
-    assert "ID: REQU.TEST.X" not in sequenced_text
+    # Verify sequencing (and ordering) with a single scan of the ID lines
+    found_ids = ID_LINE_RE.findall(sequenced_text)
+    assert found_ids == ["REQU.TEST.1", "REQU.TEST.2", "REQU.TEST.3"]
     
     # Verify bullets preserved
     assert "- item 1" in sequenced_text
@@ -157,7 +157,7 @@ def test_block_scalar_bullets_multiple_blocks(temp_yaml_file):
     assert "- last item" in sequenced_text
 
 
-def test_block_scalar_with_name_field(temp_yaml_file):
+def test_block_scalar_with_name_field(parsed_items):
     """
     Test that block scalars work for fields other than Text (like Name).
     """
@@ -176,8 +176,7 @@ def test_block_scalar_with_name_field(temp_yaml_file):
   Text: More text
 """
     
-    temp_path = temp_yaml_file(test_yaml)
-    items = parse_items(temp_path)
+    items = parsed_items(test_yaml)
     id_map = build_id_sequence_map(items)
     
     sequenced_text = apply_id_sequence_patch(test_yaml, id_map)
@@ -191,7 +190,7 @@ def test_block_scalar_with_name_field(temp_yaml_file):
     assert "- another bullet" in sequenced_text
 
 
-def test_mixed_block_scalars_and_preamble_comments(temp_yaml_file):
+def test_mixed_block_scalars_and_preamble_comments(parsed_items):
     """
     Test that block scalars with bullets work correctly when combined with preamble comments.
     """
@@ -218,8 +217,7 @@ def test_mixed_block_scalars_and_preamble_comments(temp_yaml_file):
   Name: Third requirement
 """
     
-    temp_path = temp_yaml_file(test_yaml)
-    items = parse_items(temp_path)
+    items = parsed_items(test_yaml)
     
     # Should have 2 comment items + 3 requirement items = 5 items
     assert len(items) == 5, f"Expected 5 items (2 comments + 3 requirements), got {len(items)}"
@@ -235,10 +233,9 @@ def test_mixed_block_scalars_and_preamble_comments(temp_yaml_file):
     
     sequenced_text = apply_id_sequence_patch(test_yaml, id_map)
     
-    # Verify sequencing
-    assert "ID: REQU.TEST.1" in sequenced_text
-    assert "ID: REQU.TEST.2" in sequenced_text
-    assert "ID: REQU.TEST.3" in sequenced_text
+    # Verify sequencing (and ordering) with a single scan of the ID lines
+    found_ids = ID_LINE_RE.findall(sequenced_text)
+    assert found_ids == ["REQU.TEST.1", "REQU.TEST.2", "REQU.TEST.3"]
     
     # Verify preamble comments preserved
     assert "# Preamble comment 1" in sequenced_text
@@ -247,3 +244,46 @@ def test_mixed_block_scalars_and_preamble_comments(temp_yaml_file):
     # Verify bullets preserved
     assert "- bullet 1" in sequenced_text
     assert "- bullet A" in sequenced_text
+
+
+def test_parse_items_from_text_matches_parse_items(temp_yaml_file):
+    """
+    Test that parsing pre-read text gives the same items as parsing the file,
+    including a block scalar that runs to the end of the file.
+    """
+    test_yaml = """# Preamble comment
+- Type: Requirement
+  ID: REQU.STEM.1
+  Text: |
+    (U) Features:
+    - bullet one
+
+    - bullet two
+"""
+    
+    temp_path = temp_yaml_file(test_yaml)
+    
+    assert parse_items_from_text(test_yaml) == parse_items(temp_path)
+    # The trailing newline must not add an extra blank line to the block
+    assert parse_items_from_text(test_yaml)[1]["Text"].endswith("- bullet two")
+
+
+def test_parse_items_from_text_crlf_matches_lf():
+    """
+    Test that CRLF and CR line endings parse the same as LF, as they do when
+    the file is read through open(): no trailing '\r' in values, and
+    'Text: |' still starts a block scalar.
+    """
+    test_yaml = """- Type: Requirement
+  ID: REQU.STEM.1
+  Text: |
+    (U) Features:
+    - bullet one
+  Traced_To: TRACE.1
+"""
+    
+    expected = parse_items_from_text(test_yaml)
+    
+    assert parse_items_from_text(test_yaml.replace("\n", "\r\n")) == expected
+    assert parse_items_from_text(test_yaml.replace("\n", "\r")) == expected
+    assert expected[0]["ID"] == "REQU.STEM.1"
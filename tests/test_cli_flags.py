@@ -11,275 +11,199 @@ This test suite validates that the CLI flags work correctly:
 Target Python version: 3.10.0+
 """
 
-import sys
-import os
-import subprocess
+import pytest
 
-from conftest import get_script_path
+from generate_verification_yaml import main, process_yaml_text
 
 
-def test_default_sequencing(temp_yaml_file):
-    """Test that default behavior (no flags) enables sequencing."""
-    test_yaml = """- Type: Requirement
+# One numbered anchor followed by two .X placeholders
+THREE_REQ_YAML = """- Type: Requirement
   ID: REQU.TEST.1
   Name: First requirement
   Text: |
     (U) Test requirement.
-  Verified_By: 
+  Verified_By:
 
 - Type: Requirement
   ID: REQU.TEST.X
   Name: Second requirement
   Text: |
     (U) Test requirement.
-  Verified_By: 
+  Verified_By:
 
 - Type: Requirement
   ID: REQU.TEST.X
   Name: Third requirement
   Text: |
     (U) Test requirement.
-  Verified_By: 
+  Verified_By:
 """
-    
-    input_path = temp_yaml_file(test_yaml)
-    output_path = input_path.replace('.yaml', '_output.yaml')
-    
-    try:
-        # Run without flags
-        result = subprocess.run(
-            [sys.executable, get_script_path(), input_path, output_path],
-            capture_output=True,
-            text=True
-        )
-        
-        assert result.returncode == 0, f"Script execution failed: {result.stderr}"
-        
-        with open(output_path, 'r') as f:
-            output = f.read()
-        
-        # Verify sequencing happened (should have .2 and .3)
-        assert "REQU.TEST.1" in output
-        assert "REQU.TEST.2" in output
-        assert "REQU.TEST.3" in output
-        
-        # Verify .X is not in ID lines
-        lines = output.split('\n')
-        for line in lines:
-            if 'ID: REQU.TEST.' in line:
-                assert '.X' not in line, f"Should not have .X in requirements: {line}"
-        
-    finally:
-        if os.path.exists(output_path):
-            os.remove(output_path)
-
-
-def test_no_sequence_flag(temp_yaml_file):
-    """Test that --no-sequence flag disables sequencing."""
-    test_yaml = """- Type: Requirement
-  ID: REQU.TEST.1
-  Name: First requirement
-  Text: |
-    (U) Test requirement.
-  Verified_By: 
 
-- Type: Requirement
-  ID: REQU.TEST.X
-  Name: Second requirement
-  Text: |
-    (U) Test requirement.
-  Verified_By: 
-
-- Type: Requirement
-  ID: REQU.TEST.X
-  Name: Third requirement
-  Text: |
-    (U) Test requirement.
-  Verified_By: 
-"""
-    
-    input_path = temp_yaml_file(test_yaml)
-    output_path = input_path.replace('.yaml', '_output.yaml')
-    
-    try:
-        # Run with --no-sequence
-        result = subprocess.run(
-            [sys.executable, get_script_path(), '--no-sequence', input_path, output_path],
-            capture_output=True,
-            text=True
-        )
-        
-        assert result.returncode == 0, f"Script execution failed: {result.stderr}"
-        
-        with open(output_path, 'r') as f:
-            output = f.read()
-        
-        # Verify sequencing did NOT happen (should still have .X)
-        assert "REQU.TEST.1" in output
-        assert "REQU.TEST.X" in output, "Should still have .X (not sequenced)"
-        
-        # Should NOT have .2 or .3
-        assert "REQU.TEST.2" not in output, "Should not have .2 (sequencing disabled)"
-        assert "REQU.TEST.3" not in output, "Should not have .3 (sequencing disabled)"
-        
-        # Verification IDs should also use .X
-        assert "VREQU.TEST.X" in output, "Verification should also use .X"
-        
-    finally:
-        if os.path.exists(output_path):
-            os.remove(output_path)
-
-
-def test_sequence_log_flag(temp_yaml_file):
-    """Test that --sequence-log flag prints sequencing information."""
-    test_yaml = """- Type: Requirement
+# Independent DMGR and BRDG sequences, each with one placeholder
+DMGR_BRDG_YAML = """- Type: Requirement
   ID: REQU.DMGR.TEST.1
   Name: Render first
   Text: |
     (U) The system shall render the first item.
-  Verified_By: 
+  Verified_By:
 
 - Type: Requirement
   ID: REQU.DMGR.TEST.X
   Name: Render second
   Text: |
     (U) The system shall render the second item.
-  Verified_By: 
+  Verified_By:
 
 - Type: Requirement
   ID: REQU.BRDG.TEST.5
   Name: Set first
   Text: |
     (U) The system shall set the first value.
-  Verified_By: 
+  Verified_By:
 
 - Type: Requirement
   ID: REQU.BRDG.TEST.X
   Name: Set second
   Text: |
     (U) The system shall set the second value.
-  Verified_By: 
+  Verified_By:
 """
-    
-    input_path = temp_yaml_file(test_yaml)
-    output_path = input_path.replace('.yaml', '_output.yaml')
-    
-    try:
-        # Run with --sequence-log
-        result = subprocess.run(
-            [sys.executable, get_script_path(), '--sequence-log', input_path, output_path],
-            capture_output=True,
-            text=True
-        )
-        
-        assert result.returncode == 0, f"Script execution failed: {result.stderr}"
-        
-        # Check stdout for sequencing information
-        stdout = result.stdout
-        
-        # Should have header
-        assert "ID Sequencing Summary:" in stdout, "Should have summary header"
-        
-        # Should show the sequenced IDs
-        assert "REQU.DMGR.TEST.X -> REQU.DMGR.TEST.2" in stdout, "Should show DMGR sequencing"
-        assert "REQU.BRDG.TEST.X -> REQU.BRDG.TEST.6" in stdout, "Should show BRDG sequencing"
-        
-        # Verify output file still has sequenced IDs
-        with open(output_path, 'r') as f:
-            output = f.read()
-        
-        assert "REQU.DMGR.TEST.2" in output
-        assert "REQU.BRDG.TEST.6" in output
-        
-    finally:
-        if os.path.exists(output_path):
-            os.remove(output_path)
-
-
-def test_no_sequence_with_sequence_log(temp_yaml_file):
-    """Test that --sequence-log has no effect when --no-sequence is used."""
-    test_yaml = """- Type: Requirement
-  ID: REQU.TEST.1
-  Name: First requirement
-  Text: |
-    (U) Test requirement.
-  Verified_By: 
 
-- Type: Requirement
-  ID: REQU.TEST.X
-  Name: Second requirement
-  Text: |
-    (U) Test requirement.
-  Verified_By: 
-"""
-    
-    input_path = temp_yaml_file(test_yaml)
-    output_path = input_path.replace('.yaml', '_output.yaml')
-    
-    try:
-        # Run with both flags
-        result = subprocess.run(
-            [sys.executable, get_script_path(), '--no-sequence', '--sequence-log', 
-             input_path, output_path],
-            capture_output=True,
-            text=True
-        )
-        
-        assert result.returncode == 0, f"Script execution failed: {result.stderr}"
-        
-        # Should not print any sequencing info (since sequencing is disabled)
-        stdout = result.stdout
-        assert "ID Sequencing Summary:" not in stdout, \
-            "Should not show summary when sequencing is disabled"
-        
-        # Verify output has .X (not sequenced)
-        with open(output_path, 'r') as f:
-            output = f.read()
-        
-        assert "REQU.TEST.X" in output
-        assert "REQU.TEST.2" not in output
-        
-    finally:
-        if os.path.exists(output_path):
-            os.remove(output_path)
-
-
-def test_sequence_log_with_no_placeholders(temp_yaml_file):
-    """Test that --sequence-log handles files with no placeholder IDs gracefully."""
-    test_yaml = """- Type: Requirement
+# Already-numbered IDs only: nothing to sequence
+NUMBERED_YAML = """- Type: Requirement
   ID: REQU.TEST.1
   Name: First requirement
   Text: |
     (U) Test requirement.
-  Verified_By: 
+  Verified_By:
 
 - Type: Requirement
   ID: REQU.TEST.2
   Name: Second requirement
   Text: |
     (U) Test requirement.
-  Verified_By: 
+  Verified_By:
 """
-    
+
+SUMMARY_HEADER = "ID Sequencing Summary:"
+
+
+@pytest.mark.parametrize(
+    "test_yaml,flags,stdout_contains,stdout_excludes,output_contains,output_excludes",
+    [
+        # Default behavior (no flags) enables sequencing; no .X is left in
+        # Requirement ID lines
+        pytest.param(
+            THREE_REQ_YAML, [],
+            [], [SUMMARY_HEADER],
+            ["REQU.TEST.1", "REQU.TEST.2", "REQU.TEST.3"], ["ID: REQU.TEST.X"],
+            id="default",
+        ),
+        # --no-sequence keeps .X in Requirements and generated Verifications
+        pytest.param(
+            THREE_REQ_YAML, ["--no-sequence"],
+            [], [],
+            ["REQU.TEST.1", "REQU.TEST.X", "VREQU.TEST.X"], ["REQU.TEST.2", "REQU.TEST.3"],
+            id="no-sequence",
+        ),
+        # --sequence-log prints the summary and the output is still sequenced
+        pytest.param(
+            DMGR_BRDG_YAML, ["--sequence-log"],
+            [
+                SUMMARY_HEADER,
+                "REQU.DMGR.TEST.X -> REQU.DMGR.TEST.2",
+                "REQU.BRDG.TEST.X -> REQU.BRDG.TEST.6",
+            ], [],
+            ["REQU.DMGR.TEST.2", "REQU.BRDG.TEST.6"], [],
+            id="sequence-log",
+        ),
+        # --sequence-log has no effect when --no-sequence is used
+        pytest.param(
+            THREE_REQ_YAML, ["--no-sequence", "--sequence-log"],
+            [], [SUMMARY_HEADER],
+            ["REQU.TEST.X"], ["REQU.TEST.2"],
+            id="no-sequence-with-sequence-log",
+        ),
+        # --sequence-log prints nothing when there are no placeholder IDs
+        pytest.param(
+            NUMBERED_YAML, ["--sequence-log"],
+            [], [SUMMARY_HEADER],
+            ["REQU.TEST.1", "REQU.TEST.2"], [],
+            id="sequence-log-no-placeholders",
+        ),
+    ],
+)
+def test_cli_flags(temp_yaml_file, tmp_path, capsys, test_yaml, flags,
+                   stdout_contains, stdout_excludes, output_contains, output_excludes):
+    """Test a CLI flag combination against its expected stdout and output file."""
     input_path = temp_yaml_file(test_yaml)
-    output_path = input_path.replace('.yaml', '_output.yaml')
-    
-    try:
-        # Run with --sequence-log
-        result = subprocess.run(
-            [sys.executable, get_script_path(), '--sequence-log', input_path, output_path],
-            capture_output=True,
-            text=True
-        )
-        
-        assert result.returncode == 0, f"Script execution failed: {result.stderr}"
-        
-        # Should not print summary if there's nothing to sequence
-        stdout = result.stdout
-        assert "ID Sequencing Summary:" not in stdout, \
-            "Should not show summary when there are no placeholders"
-        
-    finally:
-        if os.path.exists(output_path):
-            os.remove(output_path)
+    output_path = tmp_path / "out.yaml"
+
+    exit_code = main([*flags, input_path, str(output_path)])
+    stdout = capsys.readouterr().out
+
+    assert exit_code == 0, "Script execution failed"
+
+    for expected in stdout_contains:
+        assert expected in stdout, f"stdout should contain '{expected}':\n{stdout}"
+    for unexpected in stdout_excludes:
+        assert unexpected not in stdout, f"stdout should not contain '{unexpected}':\n{stdout}"
+
+    output = output_path.read_text(encoding="utf-8")
+
+    for expected in output_contains:
+        assert expected in output, f"Output should contain '{expected}'"
+    for unexpected in output_excludes:
+        assert unexpected not in output, f"Output should not contain '{unexpected}'"
+
+
+def test_output_file_may_be_input_file(tmp_path):
+    """Test that the input file can be rewritten in place."""
+    path = tmp_path / "requirements.yaml"
+    path.write_text(THREE_REQ_YAML, encoding="utf-8")
+
+    assert main([str(path), str(path)]) == 0
+
+    output = path.read_text(encoding="utf-8")
+    assert "ID: REQU.TEST.3" in output, "Requirements should be kept and sequenced"
+    assert "ID: VREQU.TEST.3" in output, "Verifications should be appended"
+
+
+def test_output_dash_writes_stdout(temp_yaml_file, capsys):
+    """Test that an output path of '-' writes the output to stdout."""
+    input_path = temp_yaml_file(THREE_REQ_YAML)
+
+    assert main([input_path, "-"]) == 0
+
+    stdout = capsys.readouterr().out
+    assert "ID: REQU.TEST.3" in stdout, "Requirements should be written to stdout"
+    assert "ID: VREQU.TEST.3" in stdout, "Verifications should be written to stdout"
+
+
+def test_output_dash_sequence_log_goes_to_stderr(temp_yaml_file, capsys):
+    """Test that --sequence-log with output '-' keeps the summary out of the YAML stream."""
+    input_path = temp_yaml_file(DMGR_BRDG_YAML)
+
+    assert main(["--sequence-log", input_path, "-"]) == 0
+
+    captured = capsys.readouterr()
+    assert captured.out.startswith("- Type: Requirement"), \
+        f"stdout should hold only the YAML output:\n{captured.out}"
+    assert SUMMARY_HEADER not in captured.out, "Summary should not be written to stdout"
+    assert SUMMARY_HEADER in captured.err, "Summary should be written to stderr"
+    assert "REQU.DMGR.TEST.X -> REQU.DMGR.TEST.2" in captured.err
+
+
+def test_process_yaml_text_crlf_matches_cli(tmp_path):
+    """Test that process_yaml_text() gives the CLI's output for CRLF input."""
+    crlf_yaml = THREE_REQ_YAML.replace("\n", "\r\n")
+    input_path = tmp_path / "crlf.yaml"
+    output_path = tmp_path / "out.yaml"
+    input_path.write_bytes(crlf_yaml.encode("utf-8"))
+
+    assert main([str(input_path), str(output_path)]) == 0
 
+    cli_output = output_path.read_text(encoding="utf-8")
+    assert process_yaml_text(crlf_yaml) == cli_output
+    assert "\r" not in cli_output, "Output should use '\\n' line endings"
+    assert "ID: VREQU.TEST.3" in cli_output, "Verifications should be generated"
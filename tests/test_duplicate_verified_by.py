@@ -7,225 +7,167 @@ This test suite validates that:
 3. Existing Verified_By values are replaced, not duplicated
 """
 
-import sys
-import os
-import subprocess
-from typing import List
+import re
+import difflib
+import hashlib
+from typing import Dict, List, Optional
 
-# Add parent directory to path to import the module under test
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 
-from conftest import get_script_path, temp_yaml_file
+from generate_verification_yaml import (
+    generate_verification_items,
+    parse_items_from_text,
+    process_yaml_text,
+)
 
+# Substrings the line-based checks below look for, shared by every scan
+ITEM_START = '- Type:'
+TEXT_BLOCK_LINE = 'Text: |'
+TRACED_TO_KEY = 'Traced_To:'
+VERIFIED_BY_KEY = 'Verified_By:'
 
-def extract_requirement_blocks(output_content: str) -> List[List[str]]:
+# Lines of the hyphen-list Requirement block, in their expected order
+HYPHEN_LIST_MARKERS = {
+    'Text: |': TEXT_BLOCK_LINE,
+    'first item': '- first item',
+    'second item': '- second item',
+    'Traced_To': TRACED_TO_KEY,
+    'Verified_By': VERIFIED_BY_KEY,
+}
+
+# One item block: its "- Type: <type>" start line plus every following line
+# up to (not including) the next item start line, compiled once for every scan
+ITEM_BLOCK_RE = re.compile(
+    r'^[ \t]*- Type:[ \t]*(?P<type>[^\n]*)(?:\n(?![ \t]*- Type:)[^\n]*)*',
+    re.MULTILINE,
+)
+
+# Trailing spaces/tabs at the end of any line, stripped in one pass
+TRAILING_WS_RE = re.compile(r'[ \t]+$', re.MULTILINE)
+
+
+def extract_requirement_blocks(output_content: str,
+                               max_blocks: Optional[int] = None) -> List[List[str]]:
     """
     Extract all Requirement blocks from the output content.
     
     Returns a list of blocks, where each block is a list of lines
-    representing one Requirement item.
+    representing one Requirement item. If max_blocks is given, the scan
+    stops once that many blocks are found; callers that expect exactly one
+    block pass max_blocks=2, which is enough to detect a second one.
+    
+    Item boundaries are found by ITEM_BLOCK_RE in a single regex pass, so
+    only the item start lines are inspected in Python.
     """
-    lines = output_content.split('\n')
+    # Fast path: no item start line at all
+    if ITEM_START not in output_content:
+        return []
+    
     requirement_blocks = []
-    current_block = []
-    in_requirement = False
-    
-    for line in lines:
-        if line.lstrip().startswith('- Type:'):
-            # Save previous block if it was a requirement
-            if in_requirement and current_block:
-                requirement_blocks.append(current_block)
-            
-            # Check if this is a new requirement
-            in_requirement = 'Requirement' in line and 'Verification' not in line
-            current_block = [line] if in_requirement else []
-        elif in_requirement:
-            current_block.append(line)
-    
-    # Don't forget the last block
-    if in_requirement and current_block:
-        requirement_blocks.append(current_block)
+    for match in ITEM_BLOCK_RE.finditer(output_content):
+        item_type = match.group('type')
+        if 'Requirement' in item_type and 'Verification' not in item_type:
+            requirement_blocks.append(match.group().split('\n'))
+            if max_blocks is not None and len(requirement_blocks) >= max_blocks:
+                break
     
     return requirement_blocks
 
 
 def count_verified_by_in_block(block: List[str]) -> int:
-    """Count the number of Verified_By fields in a block of lines."""
-    return sum(1 for line in block if 'Verified_By:' in line)
+    """
+    Count the number of Verified_By keys in a block of lines.
+    
+    Every occurrence counts, including one spliced into the middle of a line,
+    since that is also a corrupted (duplicate) Verified_By field.
+    """
+    return '\n'.join(block).count(VERIFIED_BY_KEY)
+
+
+def normalize_output(text: str) -> str:
+    """Strip trailing whitespace from each line and the final newline."""
+    return TRAILING_WS_RE.sub('', text).removesuffix('\n')
+
 
+def normalized_digest(text: str) -> bytes:
+    """Return a BLAKE2b digest of the normalized output, for cheap comparisons."""
+    return hashlib.blake2b(normalize_output(text).encode('utf-8'), digest_size=16).digest()
 
-def test_no_duplicate_verified_by_new_requirement(temp_yaml_file):
+
+def parse_requirements(output_content: str) -> List[Dict[str, str]]:
     """
-    Test that a new Requirement (without existing Verified_By) gets exactly one Verified_By field.
+    Parse the output with the generator's own parser and return its Requirement items.
+    
+    Block scalars are handled by the parser, so content lines are never
+    mistaken for keys or item starts.
+    """
+    return [
+        item for item in parse_items_from_text(output_content)
+        if item.get('Type', '').strip() == 'Requirement'
+    ]
+
+
+def count_verified_by_keys(item: Dict[str, str]) -> int:
     """
-    input_content = """- Type: Requirement
+    Count the Verified_By keys of a parsed item.
+    
+    The item dict keeps only the last value of a repeated key, but its
+    "_order" list records every occurrence, so duplicates are still counted.
+    """
+    return sum(1 for kind, key in item['_order'] if kind == 'key' and key == 'Verified_By')
+
+
+# A new Requirement without any Verified_By field
+NEW_REQUIREMENT_YAML = """- Type: Requirement
   ID: REQU.TEST.1
   Name: Test Requirement
   Text: |
     The system shall do something.
 """
+
+
+def test_no_duplicate_verified_by_new_requirement(run_cli, temp_yaml_file):
+    """
+    Test that a new Requirement (without existing Verified_By) gets exactly one Verified_By field.
+    """
+    input_path = temp_yaml_file(NEW_REQUIREMENT_YAML)
     
-    input_path = temp_yaml_file(input_content)
-    output_path = input_path + ".out"
-    
-    # Run the script
-    script_path = get_script_path()
-    result = subprocess.run(
-        ["python", script_path, input_path, output_path],
-        capture_output=True,
-        text=True
-    )
-    
-    assert result.returncode == 0, f"Script failed: {result.stderr}"
-    
-    # Read the output
-    with open(output_path, 'r') as f:
-        output_content = f.read()
+    # Go through the CLI entry point (main() with an argv), in-process; an
+    # output path of '-' writes to stdout, so no output file is read back
+    exit_code, output_content = run_cli(input_path, "-")
+    assert exit_code == 0, "Script execution failed"
     
-    # Extract requirement blocks
-    requirement_blocks = extract_requirement_blocks(output_content)
-    assert len(requirement_blocks) == 1, f"Expected 1 requirement block, found {len(requirement_blocks)}"
+    # Parse the requirements back
+    requirements = parse_requirements(output_content)
+    assert len(requirements) == 1, f"Expected 1 requirement, found {len(requirements)}"
     
-    # Count Verified_By occurrences in the requirement block
-    verified_by_count = count_verified_by_in_block(requirement_blocks[0])
+    # Count Verified_By keys in the requirement
+    verified_by_count = count_verified_by_keys(requirements[0])
     
     assert verified_by_count == 1, \
         f"Expected exactly 1 Verified_By field, found {verified_by_count}.\n" \
-        f"Requirement block:\n" + '\n'.join(requirement_blocks[0])
-    
-    # Cleanup
-    if os.path.exists(output_path):
-        os.remove(output_path)
+        f"Output:\n{output_content}"
 
 
-def test_no_duplicate_verified_by_existing_field(temp_yaml_file):
-    """
-    Test that a Requirement with an existing Verified_By field doesn't get a duplicate.
-    The existing value should be replaced, not duplicated.
-    """
-    input_content = """- Type: Requirement
+# Requirements for the end-to-end checks below, batched into one pipeline run:
+# - REQU.TEST.2: existing Verified_By value to replace
+# - REQU.TEST.3: no Verified_By (also used for the idempotency check)
+# - REQU.TEST.4 to REQU.TEST.6: several Requirements, with and without Verified_By
+# - REQU.TEST.7: several duplicate Verified_By fields to consolidate
+BATCH_YAML = """- Type: Requirement
   ID: REQU.TEST.2
   Name: Test Requirement
   Text: |
     The system shall do something.
   Verified_By: OLD.VALUE
-"""
-    
-    input_path = temp_yaml_file(input_content)
-    output_path = input_path + ".out"
-    
-    # Run the script
-    script_path = get_script_path()
-    result = subprocess.run(
-        ["python", script_path, input_path, output_path],
-        capture_output=True,
-        text=True
-    )
-    
-    assert result.returncode == 0, f"Script failed: {result.stderr}"
-    
-    # Read the output
-    with open(output_path, 'r') as f:
-        output_content = f.read()
-    
-    # Extract requirement blocks
-    requirement_blocks = extract_requirement_blocks(output_content)
-    assert len(requirement_blocks) == 1, f"Expected 1 requirement block, found {len(requirement_blocks)}"
-    
-    requirement_block = requirement_blocks[0]
-    
-    # Count Verified_By occurrences in the requirement block
-    verified_by_count = count_verified_by_in_block(requirement_block)
-    
-    assert verified_by_count == 1, \
-        f"Expected exactly 1 Verified_By field, found {verified_by_count}.\n" \
-        f"Requirement block:\n" + '\n'.join(requirement_block)
-    
-    # Verify the value was updated to the new verification ID
-    verified_by_line = next((line for line in requirement_block if 'Verified_By:' in line), None)
-    assert verified_by_line is not None
-    assert 'VREQU.TEST.2' in verified_by_line, \
-        f"Expected Verified_By to contain 'VREQU.TEST.2', got: {verified_by_line}"
-    assert 'OLD.VALUE' not in verified_by_line, \
-        f"Old value should be replaced, not kept: {verified_by_line}"
-    
-    # Cleanup
-    if os.path.exists(output_path):
-        os.remove(output_path)
-
 
-def test_idempotency_multiple_runs(temp_yaml_file):
-    """
-    Test that running the script multiple times produces identical output (idempotent behavior).
-    """
-    input_content = """- Type: Requirement
+- Type: Requirement
   ID: REQU.TEST.3
   Name: Test Requirement
   Text: |
     The system shall do something.
-"""
-    
-    input_path = temp_yaml_file(input_content)
-    output_path_1 = input_path + ".out1"
-    output_path_2 = input_path + ".out2"
-    
-    script_path = get_script_path()
-    
-    # First run
-    result1 = subprocess.run(
-        ["python", script_path, input_path, output_path_1],
-        capture_output=True,
-        text=True
-    )
-    assert result1.returncode == 0, f"First run failed: {result1.stderr}"
-    
-    # Second run - use output of first run as input
-    result2 = subprocess.run(
-        ["python", script_path, output_path_1, output_path_2],
-        capture_output=True,
-        text=True
-    )
-    assert result2.returncode == 0, f"Second run failed: {result2.stderr}"
-    
-    # Read both outputs
-    with open(output_path_1, 'r') as f:
-        output1 = f.read()
-    
-    with open(output_path_2, 'r') as f:
-        output2 = f.read()
-    
-    # The outputs should be identical (idempotent), ignoring trailing whitespace
-    # Normalize by stripping trailing whitespace from each line
-    def normalize_output(text):
-        return '\n'.join(line.rstrip() for line in text.splitlines())
-    
-    normalized1 = normalize_output(output1)
-    normalized2 = normalize_output(output2)
-    
-    assert normalized1 == normalized2, \
-        "Running the script twice should produce identical output (idempotency).\n" \
-        f"First run output length: {len(output1)}\n" \
-        f"Second run output length: {len(output2)}"
-    
-    # Also verify no duplicate Verified_By in the second run
-    requirement_blocks = extract_requirement_blocks(output2)
-    assert len(requirement_blocks) >= 1, "Expected at least one requirement block"
-    
-    verified_by_count = count_verified_by_in_block(requirement_blocks[0])
-    assert verified_by_count == 1, \
-        f"Expected exactly 1 Verified_By field after second run, found {verified_by_count}"
-    
-    # Cleanup
-    for path in [output_path_1, output_path_2]:
-        if os.path.exists(path):
-            os.remove(path)
-
 
-def test_multiple_requirements_no_duplicates(temp_yaml_file):
-    """
-    Test that multiple Requirements each get exactly one Verified_By field.
-    """
-    input_content = """- Type: Requirement
+- Type: Requirement
   ID: REQU.TEST.4
   Name: First Requirement
   Text: |
@@ -243,50 +185,8 @@ def test_multiple_requirements_no_duplicates(temp_yaml_file):
   Name: Third Requirement
   Text: |
     The system shall do a third thing.
-"""
-    
-    input_path = temp_yaml_file(input_content)
-    output_path = input_path + ".out"
-    
-    # Run the script
-    script_path = get_script_path()
-    result = subprocess.run(
-        ["python", script_path, input_path, output_path],
-        capture_output=True,
-        text=True
-    )
-    
-    assert result.returncode == 0, f"Script failed: {result.stderr}"
-    
-    # Read the output
-    with open(output_path, 'r') as f:
-        output_content = f.read()
-    
-    # Extract all requirement blocks
-    requirement_blocks = extract_requirement_blocks(output_content)
-    
-    # Verify we found the expected number of requirements
-    assert len(requirement_blocks) == 3, \
-        f"Expected 3 requirement blocks, found {len(requirement_blocks)}"
-    
-    # Each requirement should have exactly one Verified_By
-    for idx, block in enumerate(requirement_blocks):
-        verified_by_count = count_verified_by_in_block(block)
-        assert verified_by_count == 1, \
-            f"Requirement {idx + 1} has {verified_by_count} Verified_By fields, expected 1.\n" \
-            f"Block:\n" + '\n'.join(block)
-    
-    # Cleanup
-    if os.path.exists(output_path):
-        os.remove(output_path)
-
 
-def test_existing_duplicate_verified_by_fields(temp_yaml_file):
-    """
-    Test that if a Requirement already has multiple duplicate Verified_By fields,
-    the script consolidates them into a single field.
-    """
-    input_content = """- Type: Requirement
+- Type: Requirement
   ID: REQU.TEST.7
   Name: Test Requirement
   Text: |
@@ -295,62 +195,156 @@ def test_existing_duplicate_verified_by_fields(temp_yaml_file):
   Verified_By: OLD.VALUE2
   Verified_By: OLD.VALUE3
 """
+
+
+@pytest.fixture(scope="module")
+def batch_output():
+    """
+    Run the pipeline on BATCH_YAML once for the whole module.
     
-    input_path = temp_yaml_file(input_content)
-    output_path = input_path + ".out"
-    
-    # Run the script
-    script_path = get_script_path()
-    result = subprocess.run(
-        ["python", script_path, input_path, output_path],
-        capture_output=True,
-        text=True
-    )
-    
-    assert result.returncode == 0, f"Script failed: {result.stderr}"
-    
-    # Read the output
-    with open(output_path, 'r') as f:
-        output_content = f.read()
-    
-    # Extract requirement blocks
-    requirement_blocks = extract_requirement_blocks(output_content)
-    assert len(requirement_blocks) == 1, f"Expected 1 requirement block, found {len(requirement_blocks)}"
+    Returns (output_text, {Requirement ID: parsed Requirement item}); each test
+    asserts on its own Requirements from the shared result.
+    """
+    output_content = process_yaml_text(BATCH_YAML)
+    requirements = {item['ID']: item for item in parse_requirements(output_content)}
+    return output_content, requirements
+
+
+@pytest.mark.parametrize(
+    "req_id,must_not_contain",
+    [
+        # Existing Verified_By value is replaced, not duplicated
+        pytest.param("REQU.TEST.2", ["OLD.VALUE"], id="existing-field"),
+        # Requirement without Verified_By gets exactly one
+        pytest.param("REQU.TEST.3", [], id="new-field"),
+        # Several Requirements in one file, with and without Verified_By
+        pytest.param("REQU.TEST.4", [], id="multiple-first"),
+        pytest.param("REQU.TEST.5", ["EXISTING.VALUE"], id="multiple-second"),
+        pytest.param("REQU.TEST.6", [], id="multiple-third"),
+        # Several duplicate Verified_By fields are consolidated into one
+        pytest.param("REQU.TEST.7", ["OLD.VALUE1", "OLD.VALUE2", "OLD.VALUE3"],
+                     id="existing-duplicates"),
+    ],
+)
+def test_verified_by_invariants(batch_output, req_id, must_not_contain):
+    """
+    Test that each batched Requirement ends up with exactly one Verified_By
+    field, holding its own Verification ID and none of its old values.
+    """
+    output_content, requirements = batch_output
     
-    requirement_block = requirement_blocks[0]
+    # Every requirement of the batch must come back
+    assert len(requirements) == 6, \
+        f"Expected 6 requirements, found {len(requirements)}"
+    requirement = requirements[req_id]
     
-    # Count Verified_By occurrences in the requirement block
-    verified_by_count = count_verified_by_in_block(requirement_block)
+    # Count Verified_By keys in the requirement
+    verified_by_count = count_verified_by_keys(requirement)
     
     assert verified_by_count == 1, \
-        f"Expected exactly 1 Verified_By field, found {verified_by_count}.\n" \
-        f"Requirement block:\n" + '\n'.join(requirement_block)
+        f"Requirement {req_id} has {verified_by_count} Verified_By fields, expected 1.\n" \
+        f"Output:\n{output_content}"
     
-    # Verify the value was updated to the new verification ID
-    verified_by_line = next((line for line in requirement_block if 'Verified_By:' in line), None)
-    assert verified_by_line is not None
-    assert 'VREQU.TEST.7' in verified_by_line, \
-        f"Expected Verified_By to contain 'VREQU.TEST.7', got: {verified_by_line}"
+    # Verify the value is the new verification ID
+    verified_by = requirement.get('Verified_By', '')
+    assert 'V' + req_id in verified_by, \
+        f"Expected Verified_By to contain 'V{req_id}', got: {verified_by}"
     
     # Ensure none of the old values are present
-    for line in requirement_block:
-        if 'Verified_By:' in line:
-            assert 'OLD.VALUE1' not in line, "Old value OLD.VALUE1 should be removed"
-            assert 'OLD.VALUE2' not in line, "Old value OLD.VALUE2 should be removed"
-            assert 'OLD.VALUE3' not in line, "Old value OLD.VALUE3 should be removed"
+    for old_value in must_not_contain:
+        assert old_value not in verified_by, f"Old value {old_value} should be removed"
+
+
+def test_idempotency_multiple_runs(batch_output):
+    """
+    Test that running the script multiple times produces identical output (idempotent behavior).
+    """
+    # First run is the shared batch run
+    output1, _ = batch_output
+    
+    # Second run - use output of first run as input
+    output2 = process_yaml_text(output1)
+    
+    # The outputs should be identical (idempotent), ignoring trailing whitespace.
+    # Compare digests of the normalized outputs; the normalized texts are only
+    # kept around long enough to hash them, and a diff is built only on failure.
+    if normalized_digest(output1) != normalized_digest(output2):
+        diff = '\n'.join(difflib.unified_diff(
+            normalize_output(output1).split('\n'),
+            normalize_output(output2).split('\n'),
+            'first run', 'second run', lineterm='',
+        ))
+        pytest.fail(
+            "Running the script twice should produce identical output (idempotency).\n"
+            f"First run output length: {len(output1)}\n"
+            f"Second run output length: {len(output2)}\n"
+            f"{diff}"
+        )
+    
+    # Also verify no duplicate Verified_By in the second run
+    requirements = {item['ID']: item for item in parse_requirements(output2)}
+    assert 'REQU.TEST.3' in requirements, "Expected REQU.TEST.3 after second run"
     
-    # Cleanup
-    if os.path.exists(output_path):
-        os.remove(output_path)
+    verified_by_count = count_verified_by_keys(requirements['REQU.TEST.3'])
+    assert verified_by_count == 1, \
+        f"Expected exactly 1 Verified_By field after second run, found {verified_by_count}"
 
 
-def test_colons_in_text_block_no_false_keys(temp_yaml_file):
+def test_generate_verification_items_skips_existing_ver_ids():
     """
-    Test that colons inside Text block scalars are not treated as key-value pairs.
-    This ensures Verified_By is inserted at the correct position and not affected
-    by colons in the block content.
+    Test that Requirements whose Verification already exists are not regenerated
+    when existing_ver_ids is passed, so new Verifications can be taken directly
+    from the end of the result.
+    """
+    items = [
+        {"Type": "Requirement", "ID": "REQU.TEST.1", "Name": "Do one thing", "Text": "Text one"},
+        {"Type": "Requirement", "ID": "REQU.TEST.2", "Name": "Do another thing", "Text": "Text two"},
+        {"Type": "Verification", "ID": "VREQU.TEST.1", "Name": "Verify one thing"},
+    ]
+    
+    result = generate_verification_items(items, existing_ver_ids={"VREQU.TEST.1"})
+    new_items = result[len(items):]
+    
+    new_ids = [item.get("ID") for item in new_items if "ID" in item]
+    assert new_ids == ["VREQU.TEST.2"]
+    # FIX comments are only emitted for the Verification that is generated
+    assert sum(1 for item in new_items if "_comment" in item) == 1
+
+
+# A Verification-typed item whose ID is a REQU placeholder, so sequencing
+# renumbers it (REQU.DMGR.TEST.X -> REQU.DMGR.TEST.2)
+SEQUENCED_VERIFICATION_YAML = """- Type: Requirement
+  ID: REQU.DMGR.TEST.1
+  Name: First
+  Text: (U) The system shall render the thing.
+  Verified_By:
+
+- Type: Verification
+  ID: REQU.DMGR.TEST.X
+  Name: Odd one
+  Text: (U) Stray item.
+"""
+
+
+def test_sequenced_verification_item_not_reemitted():
+    """
+    Test that an existing Verification-typed item renumbered by sequencing stays
+    in place and is not copied again into the appended Verifications.
+
+    The new Verifications are taken from the tail of generate_verification_items()
+    rather than by filtering on existing_ver_ids, which is collected before
+    sequencing and so never held the item's renumbered ID.
     """
-    input_content = """- Type: Requirement
+    output_content = process_yaml_text(SEQUENCED_VERIFICATION_YAML)
+
+    assert output_content.count("ID: REQU.DMGR.TEST.2\n") == 1, output_content
+    assert output_content.count("Name: Odd one\n") == 1, output_content
+    assert "ID: VREQU.DMGR.TEST.1\n" in output_content
+    assert "ID: VREQU.DMGR.TEST.2\n" in output_content
+
+
+# Colons inside the Text block scalar that must not be read as keys
+COLONS_IN_TEXT_YAML = """- Type: Requirement
   ID: REQU.TEST.8
   Name: Test Requirement
   Text: |
@@ -359,26 +353,19 @@ def test_colons_in_text_block_no_false_keys(temp_yaml_file):
     Config: value
   Traced_To: TRACE.1
 """
-    
-    input_path = temp_yaml_file(input_content)
-    output_path = input_path + ".out"
-    
-    # Run the script
-    script_path = get_script_path()
-    result = subprocess.run(
-        ["python", script_path, input_path, output_path],
-        capture_output=True,
-        text=True
-    )
-    
-    assert result.returncode == 0, f"Script failed: {result.stderr}"
-    
-    # Read the output
-    with open(output_path, 'r') as f:
-        output_content = f.read()
+
+
+def test_colons_in_text_block_no_false_keys():
+    """
+    Test that colons inside Text block scalars are not treated as key-value pairs.
+    This ensures Verified_By is inserted at the correct position and not affected
+    by colons in the block content.
+    """
+    # Run the pipeline in memory
+    output_content = process_yaml_text(COLONS_IN_TEXT_YAML)
     
     # Extract requirement blocks
-    requirement_blocks = extract_requirement_blocks(output_content)
+    requirement_blocks = extract_requirement_blocks(output_content, max_blocks=2)
     assert len(requirement_blocks) == 1, f"Expected 1 requirement block, found {len(requirement_blocks)}"
     
     requirement_block = requirement_blocks[0]
@@ -396,19 +383,20 @@ def test_colons_in_text_block_no_false_keys(temp_yaml_file):
     text_end_idx = None
     
     for idx, line in enumerate(requirement_block):
-        if 'Text: |' in line:
-            # Find where text block ends (next line with <= base indentation)
+        if TEXT_BLOCK_LINE in line:
+            # Find where text block ends (next non-empty line with <= base
+            # indentation, i.e. one not indented deeper than the key line)
             base_indent = len(line) - len(line.lstrip())
-            for j in range(idx + 1, len(requirement_block)):
-                next_line = requirement_block[j]
-                if next_line.strip():  # Non-empty line
-                    next_indent = len(next_line) - len(next_line.lstrip())
-                    if next_indent <= base_indent:
-                        text_end_idx = j
-                        break
-        if 'Traced_To:' in line:
+            content_prefix = ' ' * (base_indent + 1)
+            text_end_idx = next(
+                (j for j in range(idx + 1, len(requirement_block))
+                 if requirement_block[j].strip()
+                 and not requirement_block[j].startswith(content_prefix)),
+                None,
+            )
+        if TRACED_TO_KEY in line:
             traced_to_idx = idx
-        if 'Verified_By:' in line:
+        if VERIFIED_BY_KEY in line:
             verified_by_idx = idx
     
     # Verified_By should come after the Text block ends
@@ -422,22 +410,10 @@ def test_colons_in_text_block_no_false_keys(temp_yaml_file):
         assert verified_by_idx is not None
         assert verified_by_idx > traced_to_idx, \
             f"Verified_By at line {verified_by_idx} should come after Traced_To at line {traced_to_idx}"
-    
-    # Cleanup
-    if os.path.exists(output_path):
-        os.remove(output_path)
 
 
-def test_hyphen_list_in_text_block(temp_yaml_file):
-    """
-    Test that lines starting with '- ' inside Text blocks (like bulleted lists)
-    are not treated as new item starts.
-    
-    This was a critical bug where "    - test" inside a Text block was detected
-    as a new item start, causing the item to be split incorrectly and resulting
-    in duplicate Verified_By fields and corrupted Text block content.
-    """
-    input_content = """- Type: Requirement
+# A bulleted list inside the Text block scalar that must not start new items
+HYPHEN_LIST_YAML = """- Type: Requirement
   ID: REQU.TEST.9
   Name: Test Requirement with List
   Text: |
@@ -446,30 +422,26 @@ def test_hyphen_list_in_text_block(temp_yaml_file):
     - second item
   Traced_To: TRACE.1
 """
+
+
+def test_hyphen_list_in_text_block():
+    """
+    Test that lines starting with '- ' inside Text blocks (like bulleted lists)
+    are not treated as new item starts.
     
-    input_path = temp_yaml_file(input_content)
-    output_path = input_path + ".out"
-    
-    # Run the script
-    script_path = get_script_path()
-    result = subprocess.run(
-        ["python", script_path, input_path, output_path],
-        capture_output=True,
-        text=True
-    )
-    
-    assert result.returncode == 0, f"Script failed: {result.stderr}"
-    
-    # Read the output
-    with open(output_path, 'r') as f:
-        output_content = f.read()
+    This was a critical bug where "    - test" inside a Text block was detected
+    as a new item start, causing the item to be split incorrectly and resulting
+    in duplicate Verified_By fields and corrupted Text block content.
+    """
+    # Run the pipeline in memory
+    output_content = process_yaml_text(HYPHEN_LIST_YAML)
     
     # The Text block should remain intact with both list items
     assert "- first item" in output_content, "First list item should remain in Text block"
     assert "- second item" in output_content, "Second list item should remain in Text block"
     
     # Extract requirement blocks
-    requirement_blocks = extract_requirement_blocks(output_content)
+    requirement_blocks = extract_requirement_blocks(output_content, max_blocks=2)
     assert len(requirement_blocks) == 1, f"Expected 1 requirement block, found {len(requirement_blocks)}"
     
     requirement_block = requirement_blocks[0]
@@ -482,37 +454,22 @@ def test_hyphen_list_in_text_block(temp_yaml_file):
         f"Requirement block:\n" + '\n'.join(requirement_block)
     
     # Verify the structure is correct:
-    # Text block should contain both list items, then Traced_To, then Verified_By
-    text_line_idx = None
-    first_item_idx = None
-    second_item_idx = None
-    traced_to_idx = None
-    verified_by_idx = None
-    
+    # Text block should contain both list items, then Traced_To, then Verified_By.
+    # Record the first line of each marker in one pass, stopping once all are found.
+    idx_of = {}
     for idx, line in enumerate(requirement_block):
-        if 'Text: |' in line:
-            text_line_idx = idx
-        if '- first item' in line:
-            first_item_idx = idx
-        if '- second item' in line:
-            second_item_idx = idx
-        if 'Traced_To:' in line:
-            traced_to_idx = idx
-        if 'Verified_By:' in line:
-            verified_by_idx = idx
+        for name, needle in HYPHEN_LIST_MARKERS.items():
+            if name not in idx_of and needle in line:
+                idx_of[name] = idx
+        if len(idx_of) == len(HYPHEN_LIST_MARKERS):
+            break
+    
+    missing = [name for name in HYPHEN_LIST_MARKERS if name not in idx_of]
+    assert not missing, \
+        f"Not found in Requirement block: {', '.join(missing)}\n" \
+        f"Requirement block:\n" + '\n'.join(requirement_block)
     
     # Verify order: Text, first_item, second_item, Traced_To, Verified_By
-    assert text_line_idx is not None, "Text block not found"
-    assert first_item_idx is not None, "First list item not found"
-    assert second_item_idx is not None, "Second list item not found"
-    assert traced_to_idx is not None, "Traced_To not found"
-    assert verified_by_idx is not None, "Verified_By not found"
-    
-    assert text_line_idx < first_item_idx, "First item should come after Text: | line"
-    assert first_item_idx < second_item_idx, "Second item should come after first item"
-    assert second_item_idx < traced_to_idx, "Traced_To should come after Text block content"
-    assert traced_to_idx < verified_by_idx, "Verified_By should come after Traced_To"
-    
-    # Cleanup
-    if os.path.exists(output_path):
-        os.remove(output_path)
+    positions = [idx_of[name] for name in HYPHEN_LIST_MARKERS]
+    assert all(a < b for a, b in zip(positions, positions[1:])), \
+        f"Expected order {' < '.join(HYPHEN_LIST_MARKERS)}, got line indices {idx_of}"
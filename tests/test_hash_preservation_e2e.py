@@ -15,16 +15,7 @@ import os
 import subprocess
 import tempfile
 
-# Add parent directory to path to import the module
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-
-def get_script_path():
-    """Get the absolute path to the main generate_verification_yaml.py script."""
-    return os.path.join(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-        'generate_verification_yaml.py'
-    )
+from conftest import SCRIPT_PATH
 
 
 def test_standard_name_with_hash_inline():
@@ -48,10 +39,10 @@ def test_standard_name_with_hash_inline():
     output_file = input_file + ".out"
     
     try:
-        script_path = get_script_path()
         result = subprocess.run(
-            ["python", script_path, input_file, output_file],
-            capture_output=True,
+            [sys.executable, SCRIPT_PATH, input_file, output_file],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         
@@ -103,10 +94,10 @@ def test_standard_text_with_hash_pattern():
     output_file = input_file + ".out"
     
     try:
-        script_path = get_script_path()
         result = subprocess.run(
-            ["python", script_path, input_file, output_file],
-            capture_output=True,
+            [sys.executable, SCRIPT_PATH, input_file, output_file],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         
@@ -158,10 +149,10 @@ def test_nonstandard_name_with_hash():
     output_file = input_file + ".out"
     
     try:
-        script_path = get_script_path()
         result = subprocess.run(
-            ["python", script_path, input_file, output_file],
-            capture_output=True,
+            [sys.executable, SCRIPT_PATH, input_file, output_file],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         
@@ -219,10 +210,10 @@ def test_nonstandard_text_with_hash():
     output_file = input_file + ".out"
     
     try:
-        script_path = get_script_path()
         result = subprocess.run(
-            ["python", script_path, input_file, output_file],
-            capture_output=True,
+            [sys.executable, SCRIPT_PATH, input_file, output_file],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         
@@ -280,10 +271,10 @@ def test_combined_standard_with_multiple_hashes():
     output_file = input_file + ".out"
     
     try:
-        script_path = get_script_path()
         result = subprocess.run(
-            ["python", script_path, input_file, output_file],
-            capture_output=True,
+            [sys.executable, SCRIPT_PATH, input_file, output_file],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         
@@ -330,10 +321,10 @@ def test_combined_nonstandard_with_multiple_hashes():
     output_file = input_file + ".out"
     
     try:
-        script_path = get_script_path()
         result = subprocess.run(
-            ["python", script_path, input_file, output_file],
-            capture_output=True,
+            [sys.executable, SCRIPT_PATH, input_file, output_file],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         
@@ -392,10 +383,10 @@ def test_brdg_domain_with_hash():
     output_file = input_file + ".out"
     
     try:
-        script_path = get_script_path()
         result = subprocess.run(
-            ["python", script_path, input_file, output_file],
-            capture_output=True,
+            [sys.executable, SCRIPT_PATH, input_file, output_file],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         
@@ -449,10 +440,10 @@ def test_hash_in_block_scalar_content():
     output_file = input_file + ".out"
     
     try:
-        script_path = get_script_path()
         result = subprocess.run(
-            ["python", script_path, input_file, output_file],
-            capture_output=True,
+            [sys.executable, SCRIPT_PATH, input_file, output_file],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         
@@ -9,14 +9,12 @@ This test suite validates that the generate_verification_yaml.py script correctl
 4. Does not renumber already-numbered IDs
 5. Stops sequencing when suffix diverges from stem
 6. Handles end-to-end verification generation with proper Traced_To copying
-7. Respects CLI flags (--no-sequence and --sequence-log)
+(CLI flags --no-sequence and --sequence-log are covered in test_cli_flags.py.)
 
 Target Python version: 3.10.0+
 """
 
-import sys
-import os
-import subprocess
+import re
 
 from generate_verification_yaml import (
     parse_items,
@@ -25,7 +23,15 @@ from generate_verification_yaml import (
     sequence_requirement_ids,
 )
 
-from conftest import get_script_path
+# An "ID:" line that still contains a .X placeholder
+ID_X_LINE_RE = re.compile(r'^[ \t]*ID:[^\n]*\.X.*$', re.M)
+# A Requirement "ID: REQU." line that still contains a .X placeholder
+REQU_ID_X_LINE_RE = re.compile(r'^.*ID: REQU\.[^\n]*\.X.*$', re.M)
+# The "Type:" line that starts a Verification item
+VERIFICATION_TYPE_LINE_RE = re.compile(
+    r'^.*Type: (?:DMGR Verification Requirement|BRDG Verification Requirement|Verification)',
+    re.M
+)
 
 
 # Unit tests for build_id_sequence_map()
@@ -225,6 +231,26 @@ def test_sequence_requirement_ids_basic(temp_yaml_file):
     assert "REQU.TEST.X" not in ids
 
 
+def test_sequence_requirement_ids_copy_false_updates_in_place(temp_yaml_file):
+    """Test sequence_requirement_ids(copy=False) updates IDs without copying items."""
+    test_yaml = """- Type: Requirement
+  ID: REQU.TEST.1
+  Name: First
+
+- Type: Requirement
+  ID: REQU.TEST.X
+  Name: Second
+"""
+    
+    temp_path = temp_yaml_file(test_yaml)
+    items = parse_items(temp_path)
+    sequenced_items = sequence_requirement_ids(items, copy=False)
+    
+    # Same dict objects are returned, with the placeholder ID updated in place
+    assert sequenced_items[1] is items[1]
+    assert items[1]["ID"] == "REQU.TEST.2"
+
+
 def test_sequence_requirement_ids_preserves_numbered(temp_yaml_file):
     """Test that already-numbered IDs are not renumbered."""
     test_yaml = """- Type: Requirement
@@ -366,7 +392,7 @@ def test_apply_id_sequence_patch_basic(temp_yaml_file):
 
 # End-to-end integration tests
 
-def test_end_to_end_with_verification_and_traced_to(temp_yaml_file):
+def test_end_to_end_with_verification_and_traced_to(temp_yaml_file, tmp_path, run_cli):
     """Test full pipeline including verification generation and Traced_To copying."""
     test_yaml = """- Type: Requirement
   Parent_Req: 
@@ -406,63 +432,48 @@ def test_end_to_end_with_verification_and_traced_to(temp_yaml_file):
 """
     
     input_path = temp_yaml_file(test_yaml)
-    output_path = input_path.replace('.yaml', '_output.yaml')
-    
-    try:
-        # Run the script
-        result = subprocess.run(
-            [sys.executable, get_script_path(), input_path, output_path],
-            capture_output=True,
-            text=True
-        )
-        
-        assert result.returncode == 0, f"Script execution failed: {result.stderr}"
-        
-        with open(output_path, 'r') as f:
-            output = f.read()
-        
-        # Verify sequencing happened
-        assert "REQU.DMGR.TEST.1" in output
-        assert "REQU.DMGR.TEST.2" in output, "Should have DMGR.TEST.2 (sequenced from .X)"
-        assert "REQU.BRDG.CONFIG.1" in output
-        assert "REQU.BRDG.CONFIG.2" in output, "Should have BRDG.CONFIG.2 (sequenced from .X)"
-        
-        # Verify no .X remain in requirements section
-        lines = output.split('\n')
-        in_requirements = True
-        for line in lines:
-            # Stop when we hit verifications section
-            if 'Type: DMGR Verification Requirement' in line or \
-               'Type: BRDG Verification Requirement' in line or \
-               'Type: Verification' in line:
-                in_requirements = False
-            
-            if in_requirements and 'ID: REQU.' in line:
-                assert '.X' not in line, f"Should not have .X in requirements section: {line}"
-        
-        # Verify verifications were generated with correct IDs
-        assert "VREQU.DMGR.TEST.1" in output
-        assert "VREQU.DMGR.TEST.2" in output
-        assert "VREQU.BRDG.CONFIG.1" in output
-        assert "VREQU.BRDG.CONFIG.2" in output
-        
-        # Verify Verified_By fields were updated with sequenced IDs
-        assert "Verified_By: VREQU.DMGR.TEST.2" in output
-        assert "Verified_By: VREQU.BRDG.CONFIG.2" in output
-        
-        # Verify Traced_To is copied unchanged to Verification items
-        assert "Traced_To: TRACE.DMGR.1" in output
-        assert "Traced_To: TRACE.DMGR.2" in output
-        assert "Traced_To: TRACE.BRDG.1" in output
-        assert "Traced_To: TRACE.BRDG.2" in output
-        
-        # Count Traced_To occurrences: should appear in both Req and Ver for each
-        assert output.count("Traced_To: TRACE.DMGR.1") >= 2, "Traced_To should be in both Req and Ver"
-        assert output.count("Traced_To: TRACE.DMGR.2") >= 2
-        
-    finally:
-        if os.path.exists(output_path):
-            os.remove(output_path)
+    output_path = tmp_path / "output.yaml"
+    
+    # Run the script
+    exit_code, _ = run_cli(input_path, output_path)
+    
+    assert exit_code == 0, "Script execution failed"
+    
+    output = output_path.read_text(encoding="utf-8")
+    
+    # Verify sequencing happened
+    assert "REQU.DMGR.TEST.1" in output
+    assert "REQU.DMGR.TEST.2" in output, "Should have DMGR.TEST.2 (sequenced from .X)"
+    assert "REQU.BRDG.CONFIG.1" in output
+    assert "REQU.BRDG.CONFIG.2" in output, "Should have BRDG.CONFIG.2 (sequenced from .X)"
+    
+    # Verify no .X remain in requirements section (everything before the
+    # first Verification item)
+    ver_match = VERIFICATION_TYPE_LINE_RE.search(output)
+    requirements_section = output[:ver_match.start()] if ver_match else output
+    x_match = REQU_ID_X_LINE_RE.search(requirements_section)
+    assert x_match is None, \
+        f"Should not have .X in requirements section: {x_match and x_match.group(0)}"
+    
+    # Verify verifications were generated with correct IDs
+    assert "VREQU.DMGR.TEST.1" in output
+    assert "VREQU.DMGR.TEST.2" in output
+    assert "VREQU.BRDG.CONFIG.1" in output
+    assert "VREQU.BRDG.CONFIG.2" in output
+    
+    # Verify Verified_By fields were updated with sequenced IDs
+    assert "Verified_By: VREQU.DMGR.TEST.2" in output
+    assert "Verified_By: VREQU.BRDG.CONFIG.2" in output
+    
+    # Verify Traced_To is copied unchanged to Verification items
+    assert "Traced_To: TRACE.DMGR.1" in output
+    assert "Traced_To: TRACE.DMGR.2" in output
+    assert "Traced_To: TRACE.BRDG.1" in output
+    assert "Traced_To: TRACE.BRDG.2" in output
+    
+    # Count Traced_To occurrences: should appear in both Req and Ver for each
+    assert output.count("Traced_To: TRACE.DMGR.1") >= 2, "Traced_To should be in both Req and Ver"
+    assert output.count("Traced_To: TRACE.DMGR.2") >= 2
 
 
 def test_apply_id_sequence_patch_multiple_preamble_comments(temp_yaml_file):
@@ -528,10 +539,8 @@ def test_apply_id_sequence_patch_multiple_preamble_comments(temp_yaml_file):
     assert "ID: REQU.TEST.3" in sequenced_text, "Should have REQU.TEST.3 (sequenced from second .X)"
     
     # Verify no .X remain
-    lines = sequenced_text.split('\n')
-    for line in lines:
-        if line.strip().startswith("ID:"):
-            assert ".X" not in line, f"Should not have .X in ID line: {line}"
+    x_match = ID_X_LINE_RE.search(sequenced_text)
+    assert x_match is None, f"Should not have .X in ID line: {x_match and x_match.group(0)}"
     
     # Verify preamble comments are preserved
     assert "# First preamble comment" in sequenced_text
@@ -12,12 +12,6 @@ Test cases:
 5. Regression test: Version pattern in Text
 """
 
-import sys
-import os
-
-# Add parent directory to path to import the module
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from generate_verification_yaml import parse_items
 
 
@@ -36,11 +30,7 @@ def test_single_line_name_with_hash(temp_yaml_file):
     items = parse_items(temp_path)
     
     # Find the requirement item
-    req_item = None
-    for item in items:
-        if item.get("ID") == "REQU.TEST.1":
-            req_item = item
-            break
+    req_item = next((item for item in items if item.get("ID") == "REQU.TEST.1"), None)
     
     assert req_item is not None, "Requirement item not found"
     
@@ -65,11 +55,7 @@ def test_single_line_text_with_hash_pattern(temp_yaml_file):
     items = parse_items(temp_path)
     
     # Find the requirement item
-    req_item = None
-    for item in items:
-        if item.get("ID") == "REQU.TEST.2":
-            req_item = item
-            break
+    req_item = next((item for item in items if item.get("ID") == "REQU.TEST.2"), None)
     
     assert req_item is not None, "Requirement item not found"
     
@@ -109,11 +95,10 @@ def test_fullline_comment_still_captured(temp_yaml_file):
     
     # Check that the in-item comment is in _order
     order = req_item.get("_order", [])
-    comment_found = False
-    for kind, payload in order:
-        if kind == "comment" and "in-item comment" in payload:
-            comment_found = True
-            break
+    comment_found = any(
+        kind == "comment" and "in-item comment" in payload
+        for kind, payload in order
+    )
     
     assert comment_found, "In-item comment not found in _order"
 
@@ -131,11 +116,7 @@ def test_hash_in_name_not_comment(temp_yaml_file):
     temp_path = temp_yaml_file(test_yaml)
     items = parse_items(temp_path)
     
-    req_item = None
-    for item in items:
-        if item.get("ID") == "REQU.TEST.4":
-            req_item = item
-            break
+    req_item = next((item for item in items if item.get("ID") == "REQU.TEST.4"), None)
     
     assert req_item is not None, "Requirement item not found"
     
@@ -168,11 +149,7 @@ def test_multiple_hashes_preserved(temp_yaml_file):
     temp_path = temp_yaml_file(test_yaml)
     items = parse_items(temp_path)
     
-    req_item = None
-    for item in items:
-        if item.get("ID") == "REQU.TEST.5":
-            req_item = item
-            break
+    req_item = next((item for item in items if item.get("ID") == "REQU.TEST.5"), None)
     
     assert req_item is not None, "Requirement item not found"
     
@@ -185,49 +162,3 @@ def test_multiple_hashes_preserved(temp_yaml_file):
     expected_text = "Render items #1 and #2 with color #FFFFFF"
     assert text == expected_text, \
         f"Expected Text '{expected_text}', got '{text}'"
-
-
-def _create_temp_file_standalone(content):
-    """Standalone temp file creator for when pytest is not available.
-    
-    Creates a temporary file and registers cleanup to run on process exit.
-    """
-    import tempfile
-    import atexit
-    
-    tmp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False)
-    try:
-        tmp_file.write(content)
-        tmp_path = tmp_file.name
-    finally:
-        # Ensure the file handle is closed so data is flushed to disk.
-        tmp_file.close()
-    
-    def _cleanup_temp_file() -> None:
-        """Remove the standalone temporary file on process exit."""
-        try:
-            os.remove(tmp_path)
-        except FileNotFoundError:
-            # File was already removed; nothing to do.
-            pass
-        except OSError:
-            # Ignore other OS errors during cleanup to avoid masking test results.
-            pass
-    
-    atexit.register(_cleanup_temp_file)
-    return tmp_path
-
-
-if __name__ == '__main__':
-    try:
-        import pytest
-        pytest.main([__file__, '-v'])
-    except ImportError:
-        # Fallback to basic test runner if pytest is not available
-        print("pytest not available, running tests directly")
-        test_single_line_name_with_hash(_create_temp_file_standalone)
-        test_single_line_text_with_hash_pattern(_create_temp_file_standalone)
-        test_fullline_comment_still_captured(_create_temp_file_standalone)
-        test_hash_in_name_not_comment(_create_temp_file_standalone)
-        test_multiple_hashes_preserved(_create_temp_file_standalone)
-        print("All tests passed!")
@@ -373,38 +373,6 @@ def test_end_to_end_with_formatting_variations():
         os.remove(input_path)
 
 
-def main():
-    """Run all tests."""
-    print("=" * 60)
-    print("Running item-start detection consistency tests")
-    print("=" * 60)
-    
-    try:
-        test_is_item_start()
-        test_parsing_with_leading_whitespace()
-        test_id_sequencing_with_leading_whitespace()
-        test_verified_by_patch_with_leading_whitespace()
-        test_alternate_key_ordering()
-        test_varied_spacing()
-        test_id_sequencing_with_varied_spacing()
-        test_end_to_end_with_formatting_variations()
-        
-        print("\n" + "=" * 60)
-        print("All item-start consistency tests passed! ✓")
-        print("=" * 60)
-        return 0
-        
-    except AssertionError as e:
-        print(f"\n✗ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-    except Exception as e:
-        print(f"\n✗ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-
-
 if __name__ == "__main__":
-    sys.exit(main())
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -14,11 +14,12 @@ import os
 import tempfile
 import subprocess
 
-# Add parent directory to path to import the module
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from conftest import SCRIPT_PATH
 
 from generate_verification_yaml import (
     MODAL_VERB_RULES,
+    STANDARD_TEXT_PATTERNS,
+    STANDARD_TEXT_TRIGGERS,
     is_standard_text,
     transform_text,
 )
@@ -31,6 +32,9 @@ def test_rule_table_structure():
     # Check that we have rules defined
     assert len(MODAL_VERB_RULES) > 0, "MODAL_VERB_RULES should not be empty"
     
+    # The derived tables and caches are built at import, so the table is immutable
+    assert isinstance(MODAL_VERB_RULES, tuple), "MODAL_VERB_RULES should be a tuple"
+    
     # Check that each rule has required fields
     required_fields = {"trigger", "base_verb", "domains", "priority", "requires_setting"}
     for i, rule in enumerate(MODAL_VERB_RULES):
@@ -195,6 +199,25 @@ def test_standardness_detection():
     print("✓ Standardness detection works correctly")
 
 
+def test_standard_text_patterns_match_triggers():
+    """Test that each domain's standardness pattern matches exactly its trigger phrases."""
+    print("\nTesting standard-text patterns against the trigger snapshot...")
+    
+    all_triggers = {rule["trigger"] for rule in MODAL_VERB_RULES}
+    for domain, triggers in STANDARD_TEXT_TRIGGERS.items():
+        pattern = STANDARD_TEXT_PATTERNS.get(domain)
+        if not triggers:
+            assert pattern is None, f"{domain} has no triggers, so it should have no pattern"
+            continue
+        for trigger in all_triggers:
+            text = f"The system {trigger} the value."
+            expected = any(t in text for t in triggers)
+            assert (pattern.search(text) is not None) == expected, \
+                f"{domain} pattern disagrees with its triggers for {trigger!r}"
+    
+    print("✓ Standard-text patterns match the trigger snapshot")
+
+
 def test_end_to_end_rule_table():
     """Test the full pipeline using the rule table."""
     print("\nTesting end-to-end with rule table...")
@@ -240,13 +263,10 @@ def test_end_to_end_rule_table():
         output_file = input_file.replace('.yaml', '_output.yaml')
         
         # Run the script
-        script_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 
-            'generate_verification_yaml.py'
-        )
         result = subprocess.run(
-            [sys.executable, script_path, input_file, output_file],
-            capture_output=True,
+            [sys.executable, SCRIPT_PATH, input_file, output_file],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         
@@ -291,36 +311,6 @@ def test_end_to_end_rule_table():
                 pass
 
 
-def main():
-    """Run all tests."""
-    print("=" * 60)
-    print("Testing Modal Verb Rule Table")
-    print("=" * 60)
-    
-    try:
-        test_rule_table_structure()
-        test_rule_table_has_expected_verbs()
-        test_priority_ordering()
-        test_shall_set_to_processed_before_shall_set()
-        test_rule_table_supports_render_and_overlay()
-        test_domain_specific_gating()
-        test_standardness_detection()
-        test_end_to_end_rule_table()
-        
-        print("\n" + "=" * 60)
-        print("All rule table tests passed! ✓")
-        print("=" * 60)
-        return 0
-        
-    except AssertionError as e:
-        print(f"\n✗ Test failed: {e}")
-        return 1
-    except Exception as e:
-        print(f"\n✗ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-
-
 if __name__ == "__main__":
-    sys.exit(main())
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
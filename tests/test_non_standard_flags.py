@@ -16,8 +16,7 @@ import os
 import tempfile
 import subprocess
 
-# Add parent directory to path to import the module
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from conftest import SCRIPT_PATH
 
 from generate_verification_yaml import (
     is_standard_name,
@@ -150,16 +149,14 @@ def test_end_to_end():
         output_file = input_file.replace('.yaml', '_output.yaml')
         
         # Run the script
-        script_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'generate_verification_yaml.py')
         result = subprocess.run(
-            [sys.executable, script_path, input_file, output_file],
-            capture_output=True,
+            [sys.executable, SCRIPT_PATH, input_file, output_file],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         
-        if result.returncode != 0:
-            print(f"Error running script: {result.stderr}")
-            return False
+        assert result.returncode == 0, f"Error running script: {result.stderr}"
         
         # Read and verify output
         with open(output_file, 'r') as f:
@@ -204,7 +201,6 @@ def test_end_to_end():
         assert "# FIX - BRDG must not render" in preceding_lines, "Should have BRDG render issue comment before TEST.3"
         
         print("✓ End-to-end test passed")
-        return True
         
     finally:
         # Clean up temporary files
@@ -221,32 +217,6 @@ def test_end_to_end():
                 pass
 
 
-def main():
-    """Run all tests."""
-    print("=" * 60)
-    print("Running tests for non-standard formatting flags")
-    print("=" * 60)
-    
-    try:
-        test_is_standard_name()
-        test_is_standard_text()
-        test_has_brdg_render_issue()
-        test_end_to_end()
-        
-        print("\n" + "=" * 60)
-        print("All tests passed! ✓")
-        print("=" * 60)
-        return 0
-        
-    except AssertionError as e:
-        print(f"\n✗ Test failed: {e}")
-        return 1
-    except Exception as e:
-        print(f"\n✗ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-
-
 if __name__ == "__main__":
-    sys.exit(main())
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
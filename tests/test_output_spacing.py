@@ -328,34 +328,6 @@ def test_end_to_end_spacing():
             os.remove(output_path)
 
 
-def main():
-    """Run all tests."""
-    print("=" * 60)
-    print("Running output spacing tests")
-    print("=" * 60)
-    
-    try:
-        test_comment_adjacency()
-        test_multiple_comments_and_items()
-        test_render_items_to_string_no_double_blanks()
-        test_end_to_end_spacing()
-        
-        print("\n" + "=" * 60)
-        print("All spacing tests passed! ✓")
-        print("=" * 60)
-        return 0
-        
-    except AssertionError as e:
-        print(f"\n✗ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-    except Exception as e:
-        print(f"\n✗ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-
-
 if __name__ == "__main__":
-    sys.exit(main())
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -12,8 +12,7 @@ import os
 import sys
 import subprocess
 
-# Add parent directory to path to import the module under test
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from conftest import SCRIPT_PATH
 
 from generate_verification_yaml import parse_items
 
@@ -63,13 +62,10 @@ def test_end_to_end_overlay_no_insertion():
     
     try:
         # Run the script
-        script_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            'generate_verification_yaml.py'
-        )
         result = subprocess.run(
-            ['python', script_path, input_path, output_path],
-            capture_output=True,
+            [sys.executable, SCRIPT_PATH, input_path, output_path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         
@@ -253,37 +253,6 @@ def test_edge_cases_documented_trade_offs():
     print("✓ All edge case tests passed")
 
 
-def main():
-    """Run all tests."""
-    print("=" * 60)
-    print("Testing overlay '\" in' pattern insertion policy")
-    print("Policy: 'we should not allow any overlay insertion with \" in\"'")
-    print("=" * 60)
-    print()
-    
-    try:
-        test_overlay_contexts_block_insertion()
-        test_non_overlay_contexts_allow_insertion()
-        test_render_contexts_still_block_insertion()
-        test_already_has_is_rendered()
-        test_passive_voice_allows_insertion()
-        test_render_vs_overlay_command_form_difference()
-        test_edge_cases_documented_trade_offs()
-        
-        print("\n" + "=" * 60)
-        print("All tests passed! ✓")
-        print("=" * 60)
-        return 0
-        
-    except AssertionError as e:
-        print(f"\n✗ Test failed: {e}")
-        return 1
-    except Exception as e:
-        print(f"\n✗ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-
-
 if __name__ == "__main__":
-    sys.exit(main())
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
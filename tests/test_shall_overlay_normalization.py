@@ -14,8 +14,7 @@ import os
 import tempfile
 import subprocess
 
-# Add parent directory to path to import the module
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from conftest import SCRIPT_PATH
 
 from generate_verification_yaml import (
     is_standard_text,
@@ -301,13 +300,10 @@ def test_end_to_end_dmgr_shall_overlay():
         output_file = input_file.replace('.yaml', '_output.yaml')
         
         # Run the script
-        script_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 
-            'generate_verification_yaml.py'
-        )
         result = subprocess.run(
-            [sys.executable, script_path, input_file, output_file],
-            capture_output=True,
+            [sys.executable, SCRIPT_PATH, input_file, output_file],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         
@@ -423,13 +419,10 @@ def test_end_to_end_brdg_shall_overlay_non_standard():
         output_file = input_file.replace('.yaml', '_output.yaml')
         
         # Run the script
-        script_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 
-            'generate_verification_yaml.py'
-        )
         result = subprocess.run(
-            [sys.executable, script_path, input_file, output_file],
-            capture_output=True,
+            [sys.executable, SCRIPT_PATH, input_file, output_file],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         
@@ -481,42 +474,6 @@ def test_end_to_end_brdg_shall_overlay_non_standard():
                 pass
 
 
-def main():
-    """Run all tests."""
-    print("=" * 60)
-    print("Testing 'shall overlay' verb normalization")
-    print("=" * 60)
-    
-    try:
-        test_is_standard_text_with_shall_overlay()
-        test_choose_present_verb_overlay()
-        test_transform_text_shall_overlay_singular()
-        test_transform_text_shall_overlay_plural()
-        test_transform_text_shall_overlay_without_classification()
-        test_transform_text_multiple_verbs()
-        test_transform_text_shall_overlay_brdg_no_transform()
-        test_transform_text_shall_overlay_other_no_transform()
-        test_normalize_quote_in_with_shall_overlay()
-        test_normalize_quote_in_with_overlays()
-        test_normalize_quote_in_with_overlay()
-        test_normalize_quote_in_with_overlaying()
-        test_end_to_end_dmgr_shall_overlay()
-        test_end_to_end_brdg_shall_overlay_non_standard()
-        
-        print("\n" + "=" * 60)
-        print("All tests passed! ✓")
-        print("=" * 60)
-        return 0
-        
-    except AssertionError as e:
-        print(f"\n✗ Test failed: {e}")
-        return 1
-    except Exception as e:
-        print(f"\n✗ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-
-
 if __name__ == "__main__":
-    sys.exit(main())
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -28,7 +28,8 @@ from generate_verification_yaml import (
     is_plural_subject_phrase,
     choose_be_verb,
     transform_name_general,
-    generate_verification_items
+    generate_verification_items,
+    transform_text,
 )
 
 
@@ -265,6 +266,19 @@ def test_plural_subject_morphology():
     assert verb == "are", f"Expected 'are' for '{phrase}', got '{verb}'"
 
 
+def test_non_ascii_letters_split_words_after_lowercasing():
+    """Test that tokens come from the lowercased phrase with an ASCII-only [a-z].
+
+    Case-insensitive matching would let [a-z] match letters such as 'ı' through
+    Unicode case folding, making "displaysı" the head token (plural, but ending
+    in 'ı', so read as singular) instead of "displays".
+    """
+    assert is_plural_subject_phrase("the Displaysı") == True
+    
+    result = transform_text("(U) The Displaysı shall render the map.", True, False, True)
+    assert result == "(U) Verify the Displaysı render the map.", result
+
+
 if __name__ == '__main__':
     import pytest
     pytest.main([__file__, '-v'])